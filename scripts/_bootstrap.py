@@ -0,0 +1,16 @@
+"""Make the project root importable for scripts run directly.
+
+Running ``python scripts/<folder>/<script>.py`` only puts the script's own
+directory on ``sys.path``, so each script does ``import _bootstrap`` before
+importing from ``src``. That finds the one-line ``_bootstrap.py`` in its
+folder, which runs this file. The insert is guarded so repeated runs are
+no-ops.
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
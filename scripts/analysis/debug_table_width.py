@@ -3,9 +3,7 @@
 from pathlib import Path
 
 # Setup path for imports
-import sys
-from pathlib import Path as _Path
-sys.path.insert(0, str(_Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.data_loader import load_spell_data
 from src.table_formatter import TableFormatter
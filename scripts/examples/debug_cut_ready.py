@@ -1,10 +1,9 @@
 """Debug script to check what's happening with cut-ready generation."""
 
 from pathlib import Path
-import sys
 
 # Setup path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.data_loader import load_spell_data, load_assets
 from src.card_generator import CardGenerator
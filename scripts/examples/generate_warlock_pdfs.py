@@ -1,11 +1,10 @@
 """Generate all PDF modes for warlock spells."""
 
 from pathlib import Path
-import sys
 import time
 
 # Setup path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.data_loader import load_spell_data, load_assets
 from src.card_generator import CardGenerator
@@ -14,7 +13,8 @@ from src.pdf_generator import (
     PDFGenerator,
     SingleCardPDFGenerator,
     CutReadyPDFGenerator,
-    GridConfig
+    GridConfig,
+    generate_pdfs
 )
 
 
@@ -66,87 +66,64 @@ def main():
     card_names = [spell.name for spell in spells]
     gen_time = time.time() - start_time
     
-    # MODE 1: Grid Layout
-    print("\n" + "="*80)
-    print("MODE 1: GRID LAYOUT PDFs")
-    print("="*80)
-    
-    print("\n  Creating 3×3 portrait grid...")
-    pdf_start = time.time()
-    config1 = GridConfig(rows=3, cols=3, orientation="portrait")
-    pdf_gen1 = PDFGenerator(config1)
-    result1 = pdf_gen1.generate_pdf(
-        card_names,
-        output_dir / "warlock_grid_3x3_portrait.pdf",
-        output_dir
-    )
-    print(f"  ✅ warlock_grid_3x3_portrait.pdf")
-    print(f"     {result1['total_cards']} cards, {result1['total_pages']} pages")
-    print(f"     ({time.time() - pdf_start:.1f}s)")
-    
-    print("\n  Creating 2×4 landscape grid...")
-    pdf_start = time.time()
-    config2 = GridConfig(rows=2, cols=4, orientation="landscape")
-    pdf_gen2 = PDFGenerator(config2)
-    result2 = pdf_gen2.generate_pdf(
-        card_names,
-        output_dir / "warlock_grid_2x4_landscape.pdf",
-        output_dir
-    )
-    print(f"  ✅ warlock_grid_2x4_landscape.pdf")
-    print(f"     {result2['total_cards']} cards, {result2['total_pages']} pages")
-    print(f"     ({time.time() - pdf_start:.1f}s)")
-    
-    # MODE 2: Single-Card A7
-    print("\n" + "="*80)
-    print("MODE 2: SINGLE-CARD A7 PDF")
-    print("="*80)
-    
-    print("\n  Creating A7 single-card PDF...")
-    pdf_start = time.time()
-    pdf_gen3 = SingleCardPDFGenerator()
-    result3 = pdf_gen3.generate_pdf(
-        card_names,
-        output_dir / "warlock_single_a7.pdf",
-        output_dir
-    )
-    print(f"  ✅ warlock_single_a7.pdf")
-    print(f"     {result3['total_cards']} cards, {result3['total_pages']} pages")
-    print(f"     (2 pages per card: front, back)")
-    print(f"     ({time.time() - pdf_start:.1f}s)")
-    
-    # MODE 3: Cut-Ready
-    print("\n" + "="*80)
-    print("MODE 3: CUT-READY PDFs")
-    print("="*80)
-    
-    print("\n  Creating 2×2 cut-ready portrait...")
-    pdf_start = time.time()
-    config4 = GridConfig(rows=2, cols=2, orientation="portrait", margin=5, gap_x=5, gap_y=5)
-    pdf_gen4 = CutReadyPDFGenerator(config4)
-    result4 = pdf_gen4.generate_pdf(
-        card_names,
-        output_dir / "warlock_cut_ready_2x2_portrait.pdf",
-        output_dir
-    )
-    print(f"  ✅ warlock_cut_ready_2x2_portrait.pdf")
-    print(f"     {result4['total_cards']} cards, {result4['total_pages']} pages")
-    print(f"     (Fixed 63.5×88.5mm, guidelines, bleed)")
-    print(f"     ({time.time() - pdf_start:.1f}s)")
-    
-    print("\n  Creating 2×3 cut-ready landscape...")
-    pdf_start = time.time()
-    config5 = GridConfig(rows=2, cols=3, orientation="landscape", margin=5, gap_x=5, gap_y=5)
-    pdf_gen5 = CutReadyPDFGenerator(config5)
-    result5 = pdf_gen5.generate_pdf(
+    # All five PDFs read the same card images, so build them in parallel processes
+    pdf_jobs = [
+        ("MODE 1: GRID LAYOUT PDFs", "3×3 portrait grid",
+         "warlock_grid_3x3_portrait.pdf",
+         PDFGenerator(GridConfig(rows=3, cols=3, orientation="portrait")),
+         None),
+        ("MODE 1: GRID LAYOUT PDFs", "2×4 landscape grid",
+         "warlock_grid_2x4_landscape.pdf",
+         PDFGenerator(GridConfig(rows=2, cols=4, orientation="landscape")),
+         None),
+        ("MODE 2: SINGLE-CARD A7 PDF", "A7 single-card PDF",
+         "warlock_single_a7.pdf",
+         SingleCardPDFGenerator(),
+         "2 pages per card: front, back"),
+        ("MODE 3: CUT-READY PDFs", "2×2 cut-ready portrait",
+         "warlock_cut_ready_2x2_portrait.pdf",
+         CutReadyPDFGenerator(GridConfig(rows=2, cols=2, orientation="portrait", margin=5, gap_x=5, gap_y=5)),
+         "Fixed 63.5×88.5mm, guidelines, bleed"),
+        ("MODE 3: CUT-READY PDFs", "2×3 cut-ready landscape",
+         "warlock_cut_ready_2x3_landscape.pdf",
+         CutReadyPDFGenerator(GridConfig(rows=2, cols=3, orientation="landscape", margin=5, gap_x=5, gap_y=5)),
+         "Fixed 63.5×88.5mm, guidelines, bleed"),
+    ]
+    
+    pdf_start = time.perf_counter()
+    results = generate_pdfs(
+        [(pdf_gen, output_dir / filename) for _, _, filename, pdf_gen, _ in pdf_jobs],
         card_names,
-        output_dir / "warlock_cut_ready_2x3_landscape.pdf",
-        output_dir
+        output_dir,
+        max_workers=len(pdf_jobs)
     )
-    print(f"  ✅ warlock_cut_ready_2x3_landscape.pdf")
-    print(f"     {result5['total_cards']} cards, {result5['total_pages']} pages")
-    print(f"     (Fixed 63.5×88.5mm, guidelines, bleed)")
-    print(f"     ({time.time() - pdf_start:.1f}s)")
+    pdf_time = time.perf_counter() - pdf_start
+    
+    # Report in mode order
+    results_by_file = {}
+    current_section = None
+    for (section, label, filename, _, note), result in zip(pdf_jobs, results):
+        results_by_file[filename] = result
+        
+        if section != current_section:
+            current_section = section
+            print("\n" + "="*80)
+            print(section)
+            print("="*80)
+        
+        print(f"\n  Creating {label}...")
+        print(f"  ✅ {filename}")
+        print(f"     {result['total_cards']} cards, {result['total_pages']} pages")
+        if note:
+            print(f"     ({note})")
+    
+    print(f"\n  All PDFs built in {pdf_time:.1f}s")
+    
+    result1 = results_by_file["warlock_grid_3x3_portrait.pdf"]
+    result2 = results_by_file["warlock_grid_2x4_landscape.pdf"]
+    result3 = results_by_file["warlock_single_a7.pdf"]
+    result4 = results_by_file["warlock_cut_ready_2x2_portrait.pdf"]
+    result5 = results_by_file["warlock_cut_ready_2x3_landscape.pdf"]
     
     # Summary
     total_time = time.time() - start_time
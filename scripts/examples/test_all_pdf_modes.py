@@ -1,10 +1,9 @@
 """Example script demonstrating all PDF generation modes."""
 
 from pathlib import Path
-import sys
 
 # Setup path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.data_loader import load_spell_data, load_assets
 from src.card_generator import CardGenerator
@@ -4,8 +4,7 @@
 from pathlib import Path
 
 # Setup path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.data_loader import load_spell_data, load_assets
 from src.card_generator import CardGenerator
@@ -1,10 +1,9 @@
 """Test cut-ready mode with partial pages to verify empty slots are handled correctly."""
 
 from pathlib import Path
-import sys
 
 # Setup path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.data_loader import load_spell_data, load_assets
 from src.card_generator import CardGenerator
@@ -35,9 +34,10 @@ def main():
     print("\n3. Generating card images...")
     output_dir = Path("output/partial_page_test")
     generator = CardGenerator(assets)
-    processor = BatchProcessor(generator, output_dir)
-    processor.process_spells(spells)
-    print(f"   Generated {len(spells) * 2} card images")
+    processor = BatchProcessor(generator, output_dir, in_memory=True)
+    results = processor.process_spells(spells)
+    images = processor.get_card_images(results)
+    print(f"   Generated {len(images) * 2} card images (held in memory, no PNGs written)")
     
     card_names = [spell.name for spell in spells]
     
@@ -54,7 +54,8 @@ def main():
     result = pdf_gen.generate_pdf(
         card_names,
         output_dir / "partial_page_cut_ready.pdf",
-        output_dir
+        output_dir,
+        images=images
     )
     
     print(f"\n   ✅ partial_page_cut_ready.pdf created")
@@ -1,15 +1,14 @@
 """Example script demonstrating PDF generation with grid layout."""
 
 from pathlib import Path
-import sys
 
 # Setup path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.data_loader import load_spell_data, load_assets
 from src.card_generator import CardGenerator
 from src.batch_processor import BatchProcessor
-from src.pdf_generator import PDFGenerator, GridConfig
+from src.pdf_generator import PDFGenerator, GridConfig, generate_pdfs
 
 
 def main():
@@ -37,55 +36,41 @@ def main():
     def progress_callback(current, total, spell_name):
         print(f"   [{current}/{total}] {spell_name}")
     
-    processor = BatchProcessor(generator, output_dir, progress_callback=progress_callback)
-    processor.process_spells(spells)
-    print(f"   Generated {len(spells) * 2} card images")
+    # Keep the cards in memory and hand them straight to the PDF generator
+    processor = BatchProcessor(
+        generator, output_dir, progress_callback=progress_callback, in_memory=True
+    )
+    results = processor.process_spells(spells)
+    images = processor.get_card_images(results)
+    print(f"   Generated {len(images) * 2} card images (held in memory, no PNGs written)")
     
     # Create PDF with different grid configurations
     card_names = [spell.name for spell in spells]
     
-    # Configuration 1: 3x3 portrait (default)
-    print("\n4. Creating PDF: 3x3 portrait grid...")
-    config1 = GridConfig(rows=3, cols=3, orientation="portrait")
-    pdf_gen1 = PDFGenerator(config1)
-    result1 = pdf_gen1.generate_pdf(
-        card_names,
-        Path("output/pdf_test/cards_3x3_portrait.pdf"),
-        output_dir
-    )
-    print(f"   ✅ Created: cards_3x3_portrait.pdf")
-    print(f"      Cards: {result1['total_cards']}, Pages: {result1['total_pages']}")
+    # Create PDFs with different grid configurations in one pass over the
+    # card images
+    print("\n4. Creating PDFs with 3 grid layouts...")
+    layouts = [
+        ("cards_3x3_portrait.pdf", GridConfig(rows=3, cols=3, orientation="portrait")),
+        ("cards_2x4_landscape.pdf", GridConfig(rows=2, cols=4, orientation="landscape")),
+        ("cards_4x2_portrait.pdf", GridConfig(rows=4, cols=2, orientation="portrait")),
+    ]
+    jobs = [
+        (PDFGenerator(config), Path("output/pdf_test") / filename)
+        for filename, config in layouts
+    ]
+    pdf_results = generate_pdfs(jobs, card_names, output_dir, images=images)
     
-    # Configuration 2: 2x4 landscape
-    print("\n5. Creating PDF: 2x4 landscape grid...")
-    config2 = GridConfig(rows=2, cols=4, orientation="landscape")
-    pdf_gen2 = PDFGenerator(config2)
-    result2 = pdf_gen2.generate_pdf(
-        card_names,
-        Path("output/pdf_test/cards_2x4_landscape.pdf"),
-        output_dir
-    )
-    print(f"   ✅ Created: cards_2x4_landscape.pdf")
-    print(f"      Cards: {result2['total_cards']}, Pages: {result2['total_pages']}")
-    
-    # Configuration 3: 4x2 portrait (more cards per page)
-    print("\n6. Creating PDF: 4x2 portrait grid...")
-    config3 = GridConfig(rows=4, cols=2, orientation="portrait")
-    pdf_gen3 = PDFGenerator(config3)
-    result3 = pdf_gen3.generate_pdf(
-        card_names,
-        Path("output/pdf_test/cards_4x2_portrait.pdf"),
-        output_dir
-    )
-    print(f"   ✅ Created: cards_4x2_portrait.pdf")
-    print(f"      Cards: {result3['total_cards']}, Pages: {result3['total_pages']}")
+    for (filename, _), result in zip(layouts, pdf_results):
+        print(f"   ✅ Created: {filename}")
+        print(f"      Cards: {result['total_cards']}, Pages: {result['total_pages']}")
     
     print("\n" + "="*80)
     print("SUMMARY")
     print("="*80)
-    print(f"Generated {len(spells)} spell cards")
+    print(f"Generated {len(images)} spell cards")
     print(f"Created 3 PDF files with different grid layouts")
-    print(f"Output directory: {output_dir}")
+    print(f"PDF directory: {output_dir} (card images were kept in memory)")
     print("\nPDF files:")
     print("  - cards_3x3_portrait.pdf   (3 rows × 3 cols, portrait)")
     print("  - cards_2x4_landscape.pdf  (2 rows × 4 cols, landscape)")
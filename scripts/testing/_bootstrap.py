@@ -0,0 +1,8 @@
+"""Put the project root on sys.path via the shared scripts/_bootstrap.py."""
+
+import os
+import runpy
+
+PROJECT_ROOT = runpy.run_path(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "_bootstrap.py")
+)["PROJECT_ROOT"]
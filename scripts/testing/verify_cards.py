@@ -1,24 +1,62 @@
 #!/usr/bin/env python3
 """Verify generated cards are valid images."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
 
+def list_png_files(directory: Path):
+    """Return the PNG file entries in directory, sorted by name.
+    
+    A missing directory has no cards, so the result is empty.
+    """
+    # scandir entries carry the file type, so no extra stat per file
+    try:
+        with os.scandir(directory) as it:
+            return sorted(
+                (e for e in it if e.is_file() and e.name.endswith(".png")),
+                key=lambda e: e.name
+            )
+    except FileNotFoundError:
+        return []
+
+
+def inspect_card(path: str):
+    """Return (width, height, mode) for a card image.
+    
+    Image.open only reads the header; pixel data is never decoded.
+    """
+    with Image.open(path) as img:
+        return (*img.size, img.mode)
+
+
+def _inspect_or_error(path: str):
+    """Return the card's (width, height, mode), or the error raised."""
+    try:
+        return inspect_card(path)
+    except Exception as e:
+        return e
+
+
 def main():
     output_dir = Path("output")
     
     print("Verifying generated cards...\n")
     
-    for img_path in sorted(output_dir.glob("*.png")):
-        try:
-            img = Image.open(img_path)
-            width, height = img.size
-            mode = img.mode
-            print(f"✓ {img_path.name}")
-            print(f"  Size: {width}x{height}, Mode: {mode}")
-        except Exception as e:
-            print(f"✗ {img_path.name}: {e}")
+    # File reads overlap; results are still reported in name order
+    entries = list_png_files(output_dir)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_inspect_or_error, (e.path for e in entries)))
+    
+    for entry, result in zip(entries, results):
+        if isinstance(result, Exception):
+            print(f"✗ {entry.name}: {result}")
+            continue
+        width, height, mode = result
+        print(f"✓ {entry.name}")
+        print(f"  Size: {width}x{height}, Mode: {mode}")
     
     print("\n✅ All cards verified!")
 
@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 """Verify edge case cards."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
 
+def _probe(img_path: Path):
+    """Return (width, height, size in KB) of an image, or the error raised."""
+    try:
+        with Image.open(img_path) as img:
+            width, height = img.size
+        return width, height, img_path.stat().st_size / 1024
+    except Exception as e:
+        return e
+
+
 def main():
     output_dir = Path("output/edge_cases")
     
@@ -17,19 +28,27 @@ def main():
         "Sleep": "Long description with conditions"
     }
     
+    # Open all images concurrently (header parsing and stat are I/O bound)
+    sides = ["front", "back"]
+    paths = [
+        output_dir / f"{spell_name}_{side}.png"
+        for spell_name in cards
+        for side in sides
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        probes = iter(list(executor.map(_probe, paths)))
+    
     for spell_name, note in cards.items():
         print(f"📋 {spell_name}")
         print(f"   {note}")
         
-        for side in ["front", "back"]:
-            img_path = output_dir / f"{spell_name}_{side}.png"
-            try:
-                img = Image.open(img_path)
-                width, height = img.size
-                file_size = img_path.stat().st_size / 1024  # KB
+        for side in sides:
+            probe = next(probes)
+            if isinstance(probe, Exception):
+                print(f"   ✗ {side.capitalize()}: {probe}")
+            else:
+                width, height, file_size = probe
                 print(f"   ✓ {side.capitalize()}: {width}x{height}, {file_size:.1f}KB")
-            except Exception as e:
-                print(f"   ✗ {side.capitalize()}: {e}")
         print()
     
     print("✅ All edge case cards verified successfully!")
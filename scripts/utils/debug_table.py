@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 """Debug table parsing."""
 
+import re
 from pathlib import Path
 
 # Setup path for imports
-import sys
-from pathlib import Path as _Path
-sys.path.insert(0, str(_Path(__file__).parent.parent.parent))
+import _bootstrap  # noqa: F401
 
 from src.data_loader import load_spell_data
 
@@ -14,8 +13,16 @@ csv_path = Path("test_data/teleport_spell.csv")
 spells = load_spell_data(csv_path)
 spell = spells[0]
 
+# Locate every marker in one scan (first occurrence each, -1 if absent)
+MARKER_PATTERN = re.compile(
+    r"Teleportation Outcome|Permanent circle|Linked object|Very familiar"
+)
+hits = {}
+for match in MARKER_PATTERN.finditer(spell.description):
+    hits.setdefault(match.group(), match.start())
+
 # Find the table section
-table_start = spell.description.find("Teleportation Outcome")
+table_start = hits.get("Teleportation Outcome", -1)
 table_section = spell.description[table_start:table_start+500]
 
 print("RAW TABLE SECTION:")
@@ -25,16 +32,16 @@ print("=" * 70)
 
 # Show character by character for the first row
 print("\nFIRST DATA ROW (Permanent circle):")
-perm_start = spell.description.find("Permanent circle")
+perm_start = hits.get("Permanent circle", -1)
 perm_section = spell.description[perm_start:perm_start+50]
 print(repr(perm_section))
 
 print("\nSECOND DATA ROW (Linked object):")
-link_start = spell.description.find("Linked object")
+link_start = hits.get("Linked object", -1)
 link_section = spell.description[link_start:link_start+50]
 print(repr(link_section))
 
 print("\nTHIRD DATA ROW (Very familiar):")
-very_start = spell.description.find("Very familiar")
+very_start = hits.get("Very familiar", -1)
 very_section = spell.description[very_start:very_start+50]
 print(repr(very_section))
\ No newline at end of file
@@ -1,8 +1,35 @@
 """Display test summary and project status."""
 
-import subprocess
+import importlib.util
+import os
 from pathlib import Path
 
+import pytest
+
+# Setup path for imports
+from _bootstrap import PROJECT_ROOT
+
+
+def _line_count(path: Path) -> int:
+    """Count the lines of a file without decoding it."""
+    data = path.read_bytes()
+    if not data:
+        return 0
+    # A last line without a trailing newline still counts
+    return data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+
+
+def _python_files(directory: Path, prefix: str = "") -> list:
+    """List a directory's .py files (optionally name-prefixed), sorted by name."""
+    with os.scandir(directory) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.startswith(prefix)
+            and entry.name.endswith(".py")
+            and entry.is_file(follow_symlinks=False)
+        )
+
 
 def run_tests():
     """Run all tests and display summary."""
@@ -10,32 +37,38 @@ def run_tests():
     print("D&D SPELL CARD GENERATOR V2 - TEST SUMMARY")
     print("="*70)
     
-    # Run pytest with summary
-    result = subprocess.run(
-        ["python", "-m", "pytest", "tests/", "-v", "--tb=no", "-q"],
-        cwd=Path(__file__).parent,
-        capture_output=True,
-        text=True
-    )
+    # Run pytest in this process (once per process, since test modules stay
+    # imported) instead of starting a second interpreter
+    args = ["tests/", "-v", "--tb=no", "-q"]
+    if importlib.util.find_spec("xdist") is not None:
+        # Optional plugin. loadscope runs each test module/class on a single
+        # worker, so its module- and class-scoped fixtures are set up once
+        # (session fixtures are still built once per worker)
+        args += ["-n", "auto", "--dist=loadscope"]
     
-    print(result.stdout)
+    cwd = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        pytest.main(args)
+    finally:
+        os.chdir(cwd)
     
     # Count files
-    src_files = list(Path("src").glob("*.py"))
-    test_files = list(Path("tests").glob("test_*.py"))
+    src_files = _python_files(Path(PROJECT_ROOT, "src"))
+    test_files = _python_files(Path(PROJECT_ROOT, "tests"), prefix="test_")
     
     print("\n" + "="*70)
     print("PROJECT STATUS")
     print("="*70)
     
     print(f"\nSource Files ({len(src_files)}):")
-    for f in sorted(src_files):
-        lines = len(f.read_text().splitlines())
+    for f in src_files:
+        lines = _line_count(f)
         print(f"  - {f.name:30s} ({lines:4d} lines)")
     
     print(f"\nTest Files ({len(test_files)}):")
-    for f in sorted(test_files):
-        lines = len(f.read_text().splitlines())
+    for f in test_files:
+        lines = _line_count(f)
         print(f"  - {f.name:30s} ({lines:4d} lines)")
     
     print("\n" + "="*70)
@@ -1,10 +1,15 @@
 """Batch processing for generating multiple spell cards."""
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
-from dataclasses import dataclass
+from typing import List, Dict, Iterator, Optional, Callable, Tuple
+from dataclasses import dataclass, replace
 
-from .models import SpellData, AssetCollection
+from PIL import Image
+
+from .models import SpellData, AssetCollection, sanitize_filename
 from .card_generator import CardGenerator
 
 
@@ -16,6 +21,35 @@ class ProcessingResult:
     front_path: Optional[Path] = None
     back_path: Optional[Path] = None
     error: Optional[str] = None
+    front_image: Optional[Image.Image] = None
+    back_image: Optional[Image.Image] = None
+
+
+# Per-process batch processor used by worker processes (set by _init_worker)
+_worker_processor: Optional["BatchProcessor"] = None
+
+
+def _init_worker(card_generator: CardGenerator, output_dir: Path, in_memory: bool) -> None:
+    """Create the batch processor for a worker process once, at pool startup."""
+    global _worker_processor
+    _worker_processor = BatchProcessor(card_generator, output_dir, in_memory=in_memory)
+
+
+def _process_in_worker(spell: SpellData) -> "ProcessingResult":
+    """Process a single spell inside a worker process.
+    
+    In-memory card images are sent back to the main process without their
+    alpha channel. The PDF generators drop it anyway, so this cuts the
+    pickled data by a quarter and does the conversion in the worker.
+    """
+    result = _worker_processor._process_single_spell(spell)
+    if result.front_image is not None:
+        result = replace(
+            result,
+            front_image=result.front_image.convert("RGB"),
+            back_image=result.back_image.convert("RGB")
+        )
+    return result
 
 
 class BatchProcessor:
@@ -25,7 +59,9 @@ class BatchProcessor:
         self,
         card_generator: CardGenerator,
         output_dir: Path,
-        progress_callback: Optional[Callable[[int, int, str], None]] = None
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_workers: int = 1,
+        in_memory: bool = False
     ):
         """
         Initialize batch processor.
@@ -34,10 +70,17 @@ class BatchProcessor:
             card_generator: CardGenerator instance
             output_dir: Directory for output images
             progress_callback: Optional callback(current, total, spell_name)
+            max_workers: Number of worker processes (1 = process in this
+                process). The card generator must be picklable when > 1.
+            in_memory: Keep card images on the results instead of writing
+                PNG files (see get_card_images). Images from worker
+                processes come back as RGB.
         """
         self.card_generator = card_generator
         self.output_dir = Path(output_dir)
         self.progress_callback = progress_callback
+        self.max_workers = max_workers
+        self.in_memory = in_memory
         
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -52,19 +95,56 @@ class BatchProcessor:
         Returns:
             Dictionary mapping spell names to processing results
         """
-        results = {}
+        return {result.spell_name: result for result in self.iter_results(spells)}
+    
+    def iter_results(self, spells: List[SpellData]) -> Iterator[ProcessingResult]:
+        """
+        Process spells, yielding each result as soon as it is available.
+        
+        Results come in input order, so a consumer such as PDF generation
+        can start on the first cards while later ones are still rendering.
+        With a single worker each spell is processed only when the next
+        result is requested; with a pool, at most two spells per worker are
+        in flight, so finished in-memory images do not pile up ahead of a
+        slower consumer. Progress is reported in input order.
+        
+        Args:
+            spells: List of spell data to process
+            
+        Yields:
+            ProcessingResult of each spell, in input order
+        """
         total = len(spells)
         
+        if self.max_workers > 1 and total > 1:
+            workers = min(self.max_workers, total)
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.card_generator, self.output_dir, self.in_memory)
+            ) as executor:
+                pending = deque()
+                remaining = iter(spells)
+                for spell in islice(remaining, 2 * workers):
+                    pending.append(executor.submit(_process_in_worker, spell))
+                
+                for i in range(1, total + 1):
+                    result = pending.popleft().result()
+                    # Keep the pool busy while the caller handles this result
+                    for spell in islice(remaining, 1):
+                        pending.append(executor.submit(_process_in_worker, spell))
+                    if self.progress_callback:
+                        self.progress_callback(i, total, result.spell_name)
+                    yield result
+            return
+        
         for i, spell in enumerate(spells, 1):
             # Report progress
             if self.progress_callback:
                 self.progress_callback(i, total, spell.name)
             
             # Process this spell
-            result = self._process_single_spell(spell)
-            results[spell.name] = result
-        
-        return results
+            yield self._process_single_spell(spell)
     
     def _process_single_spell(self, spell: SpellData) -> ProcessingResult:
         """
@@ -77,8 +157,17 @@ class BatchProcessor:
             ProcessingResult with success/failure information
         """
         try:
+            if self.in_memory:
+                # Keep the images for direct PDF embedding, skip the PNG files
+                return ProcessingResult(
+                    spell_name=spell.name,
+                    success=True,
+                    front_image=self.card_generator.generate_card_front(spell, None),
+                    back_image=self.card_generator.generate_card_back(spell, None)
+                )
+            
             # Generate filenames
-            safe_name = self._sanitize_filename(spell.name)
+            safe_name = spell.safe_name
             front_path = self.output_dir / f"{safe_name}_front.png"
             back_path = self.output_dir / f"{safe_name}_back.png"
             
@@ -111,18 +200,29 @@ class BatchProcessor:
         Returns:
             Safe filename string
         """
-        # Replace spaces with underscores
-        safe = name.replace(" ", "_")
-        
-        # Remove or replace unsafe characters (including apostrophes)
-        unsafe_chars = '<>:"/\\|?*\''
-        for char in unsafe_chars:
-            safe = safe.replace(char, "")
-        
-        # Convert to lowercase
-        safe = safe.lower()
+        # Spaces -> underscores, unsafe characters (including apostrophes)
+        # removed, lowercased - in a single translate pass
+        return sanitize_filename(name)
+    
+    @staticmethod
+    def get_card_images(
+        results: Dict[str, ProcessingResult]
+    ) -> Dict[str, Tuple[Image.Image, Image.Image]]:
+        """
+        Collect in-memory card images for PDF generation.
         
-        return safe
+        Args:
+            results: Processing results from an in-memory batch
+            
+        Returns:
+            Dictionary mapping spell names to (front, back) images, for the
+            images argument of the PDF generators
+        """
+        return {
+            name: (result.front_image, result.back_image)
+            for name, result in results.items()
+            if result.success and result.front_image is not None
+        }
     
     def get_summary(self, results: Dict[str, ProcessingResult]) -> Dict[str, any]:
         """
@@ -1,9 +1,14 @@
 """Card generation for spell cards."""
 
+import hashlib
+import io
+import os
+import tempfile
+from collections import OrderedDict
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from PIL import Image
-from .models import SpellData, AssetCollection
+from .models import SpellData, AssetCollection, RESIZE_QUALITIES
 from .text_renderer import TextRenderer
 from .table_formatter import TableFormatter
 
@@ -11,19 +16,259 @@ from .table_formatter import TableFormatter
 class CardGenerator:
     """Generates spell card images (front and back)."""
     
-    def __init__(self, assets: AssetCollection):
+    # Number of background + class banner composites kept in memory per
+    # card side (one per class combination, ~3 MB each)
+    BANNER_BASE_CACHE_SIZE = 16
+    
+    # Illustrations are resized to a square of this side (477x477 based on v1)
+    ILLUSTRATION_SIZE = 477
+    
+    # Number of rendered spell name banners kept in memory (~0.8 MB each);
+    # a card's front and back share one render
+    SPELL_BANNER_CACHE_SIZE = 8
+    
+    # Number of resized illustrations kept in memory (~0.9 MB each)
+    ILLUSTRATION_CACHE_SIZE = 32
+    
+    # Illustration resize quality levels: "fast" uses bilinear filtering,
+    # "balanced" uses bicubic for sources within RESIZE_NEAR_RATIO of the
+    # target size (where it is indistinguishable) and LANCZOS otherwise,
+    # "best" always uses LANCZOS
+    RESIZE_QUALITIES = RESIZE_QUALITIES
+    RESIZE_NEAR_RATIO = (0.7, 1.4)
+    
+    def __init__(
+        self,
+        assets: AssetCollection,
+        png_compress_level: int = 6,
+        illustration_cache_dir: Optional[Path] = None,
+        resize_quality: str = "best"
+    ):
         """
         Initialize card generator with assets.
         
         Args:
             assets: Collection of graphical assets
+            png_compress_level: zlib level (0-9) for saved PNGs. Use a low
+                level for intermediate images that are only embedded in a PDF.
+            illustration_cache_dir: Optional directory for resized
+                illustrations, so later runs skip the resampling
+            resize_quality: Illustration resize quality, one of
+                RESIZE_QUALITIES
+            
+        Raises:
+            ValueError: If resize_quality is not a known quality level
         """
+        if resize_quality not in self.RESIZE_QUALITIES:
+            raise ValueError(
+                f"resize_quality must be one of {', '.join(self.RESIZE_QUALITIES)}, "
+                f"got '{resize_quality}'"
+            )
+        
         self.assets = assets
+        self.png_compress_level = png_compress_level
+        self.illustration_cache_dir = illustration_cache_dir
+        self.resize_quality = resize_quality
         self.text_renderer = TextRenderer(assets.font_path)
+        
+        # Decoded static assets and the background+frame composite are the
+        # same for every card, so they are built once and copied per card
+        self._asset_cache: Dict[Path, Image.Image] = {}
+        self._overlay_cache: Dict[Path, Tuple[Image.Image, Tuple[int, int]]] = {}
+        self._front_template: Optional[Image.Image] = None
+        self._spell_banner_base: Optional[Image.Image] = None
+        self._front_bases: "OrderedDict[Tuple[str, ...], Image.Image]" = OrderedDict()
+        self._back_bases: "OrderedDict[Tuple[str, ...], Image.Image]" = OrderedDict()
+        self._illustrations: "OrderedDict[Tuple[Path, int], Image.Image]" = OrderedDict()
+        self._spell_banners: "OrderedDict[str, Image.Image]" = OrderedDict()
     
     def _load_image(self, path: Path) -> Image.Image:
-        """Load and convert image to RGBA."""
-        return Image.open(path).convert("RGBA")
+        """Load and convert image to RGBA (skipping the copy if it already is)."""
+        image = Image.open(path)
+        if image.mode == "RGBA":
+            image.load()
+            return image
+        return image.convert("RGBA")
+    
+    def _load_asset(self, path: Path) -> Image.Image:
+        """
+        Load a static asset image once and reuse it.
+        
+        The returned image is shared, so callers must copy it before drawing.
+        """
+        image = self._asset_cache.get(path)
+        if image is None:
+            image = self._load_image(path)
+            self._asset_cache[path] = image
+        return image
+    
+    def _load_overlay(self, path: Path) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Load a full-card overlay cropped to its visible (non-transparent) area.
+        
+        Overlays such as class banners are card-sized but mostly transparent.
+        Pasting only the visible region gives the same result while blending
+        a fraction of the pixels.
+        
+        Args:
+            path: Path to overlay image
+            
+        Returns:
+            Tuple of (cropped overlay, (x, y) offset on the card)
+        """
+        cached = self._overlay_cache.get(path)
+        if cached is None:
+            image = self._load_asset(path)
+            bbox = image.getchannel("A").getbbox()
+            if bbox is None:
+                cached = (image.crop((0, 0, 0, 0)), (0, 0))
+            else:
+                cached = (image.crop(bbox), (bbox[0], bbox[1]))
+            self._overlay_cache[path] = cached
+        return cached
+    
+    def _paste_overlay(self, base: Image.Image, path: Path) -> None:
+        """Paste a full-card overlay onto base, blending only its visible area."""
+        overlay, position = self._load_overlay(path)
+        self._paste_with_alpha(base, overlay, position)
+    
+    def _get_front_template(self) -> Image.Image:
+        """Return the front background with the frame applied (shared, do not modify)."""
+        if self._front_template is None:
+            template = self._load_asset(self.assets.front_background).copy()
+            self._paste_overlay(template, self.assets.front_frame)
+            self._front_template = template
+        return self._front_template
+    
+    def _illustration_resample(self, size: Tuple[int, int]) -> Image.Resampling:
+        """Pick the resampling filter for an illustration of the given size."""
+        if self.resize_quality == "fast":
+            return Image.Resampling.BILINEAR
+        if self.resize_quality == "balanced":
+            low, high = self.RESIZE_NEAR_RATIO
+            if low < max(size) / self.ILLUSTRATION_SIZE < high:
+                return Image.Resampling.BICUBIC
+        return Image.Resampling.LANCZOS
+    
+    def _load_illustration(self, path: Path) -> Image.Image:
+        """
+        Load an illustration resized to the illustration area.
+        
+        Resized illustrations are kept in a small LRU keyed by path and
+        modification time, and optionally in illustration_cache_dir.
+        
+        Args:
+            path: Path to illustration image
+            
+        Returns:
+            Resized RGBA illustration (shared, do not modify)
+        """
+        key = (path, path.stat().st_mtime_ns)
+        illustration = self._illustrations.get(key)
+        if illustration is not None:
+            self._illustrations.move_to_end(key)
+            return illustration
+        
+        cache_path = None
+        if self.illustration_cache_dir is not None:
+            digest = hashlib.blake2b(
+                f"{path.resolve()}:{key[1]}:{self.ILLUSTRATION_SIZE}:"
+                f"{self.resize_quality}".encode(),
+                digest_size=16
+            ).hexdigest()
+            cache_path = Path(self.illustration_cache_dir) / f"{digest}.png"
+        
+        illustration = None
+        if cache_path is not None and cache_path.exists():
+            try:
+                illustration = self._load_image(cache_path)
+            except OSError:
+                # Unreadable cache file: resize again and replace it
+                illustration = None
+        
+        if illustration is None:
+            illustration = self._load_image(path)
+            illustration = illustration.resize(
+                (self.ILLUSTRATION_SIZE, self.ILLUSTRATION_SIZE),
+                self._illustration_resample(illustration.size)
+            )
+            if cache_path is not None:
+                self._save_cached_illustration(illustration, cache_path)
+        
+        self._illustrations[key] = illustration
+        if len(self._illustrations) > self.ILLUSTRATION_CACHE_SIZE:
+            self._illustrations.popitem(last=False)
+        return illustration
+    
+    @staticmethod
+    def _save_cached_illustration(illustration: Image.Image, cache_path: Path) -> None:
+        """
+        Write a resized illustration to the disk cache.
+        
+        The file is written under a temporary name and renamed into place,
+        so worker processes sharing the cache never read a partial PNG.
+        PNG is lossless, so a cached copy renders exactly like a fresh resize.
+        """
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=cache_path.stem, suffix=".tmp", dir=cache_path.parent
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                illustration.save(f, "PNG", compress_level=1)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    
+    def _get_spell_banner_base(self) -> Image.Image:
+        """
+        Return the spell name banner cut off below its visible area.
+        
+        The banner asset is card-sized but only its top part is visible.
+        Dropping the transparent rows below keeps the (0, 0) origin, so text
+        coordinates are unchanged, while each card copies and blends a
+        fraction of the pixels (shared, do not modify).
+        """
+        if self._spell_banner_base is None:
+            banner = self._load_asset(self.assets.spell_banner)
+            bbox = banner.getchannel("A").getbbox()
+            bottom = bbox[3] if bbox is not None else banner.height
+            self._spell_banner_base = banner.crop((0, 0, banner.width, bottom))
+        return self._spell_banner_base
+    
+    def _render_spell_banner(self, spell_name: str) -> Image.Image:
+        """
+        Return the spell name banner with the name drawn on it.
+        
+        The front and back of a card carry the same banner, so renders are
+        kept in a small LRU and the text is laid out once per spell.
+        
+        Args:
+            spell_name: Name to draw
+            
+        Returns:
+            Rendered banner, pasted at (0, 0) (shared, do not modify)
+        """
+        banner = self._spell_banners.get(spell_name)
+        if banner is not None:
+            self._spell_banners.move_to_end(spell_name)
+            return banner
+        
+        banner = self._get_spell_banner_base().copy()
+        self.text_renderer.render_text_centered(
+            banner,
+            spell_name,
+            center=(banner.width // 2, 145),
+            max_width=banner.width - 80,
+            max_height=90,
+            max_font_size=36,
+            color="black"
+        )
+        self._spell_banners[spell_name] = banner
+        if len(self._spell_banners) > self.SPELL_BANNER_CACHE_SIZE:
+            self._spell_banners.popitem(last=False)
+        return banner
     
     def _paste_with_alpha(
         self,
@@ -41,55 +286,133 @@ class CardGenerator:
         """
         base.paste(overlay, position, overlay)
     
+    def _paste_class_banners(self, card: Image.Image, classes: List[str]) -> None:
+        """
+        Paste the banner of each known class onto the card.
+        
+        Args:
+            card: Card image to paste onto
+            classes: Class names in display order
+        """
+        for class_name in classes:
+            banner_path = self.assets.class_banners.get(class_name)
+            if banner_path is None:
+                continue
+            # Banners already decoded need no existence check
+            if banner_path in self._overlay_cache or banner_path.exists():
+                self._paste_overlay(card, banner_path)
+    
+    def _get_front_base(self, classes: List[str]) -> Image.Image:
+        """
+        Return the framed front background with class banners applied.
+        
+        Used for cards without an illustration, whose front differs only in
+        text beyond this layer (shared, do not modify).
+        
+        Args:
+            classes: Class names in display order
+            
+        Returns:
+            Front base image for the class combination
+        """
+        return self._get_banner_base(self._front_bases, classes, self._get_front_template)
+    
+    def _get_back_base(self, classes: List[str]) -> Image.Image:
+        """
+        Return the back background with class banners applied.
+        
+        Everything else on a card back is spell-specific, so this layer is
+        the part that repeats across a batch (shared, do not modify).
+        
+        Args:
+            classes: Class names in display order
+            
+        Returns:
+            Back base image for the class combination
+        """
+        return self._get_banner_base(
+            self._back_bases,
+            classes,
+            lambda: self._load_asset(self.assets.back_background)
+        )
+    
+    def _get_banner_base(
+        self,
+        cache: "OrderedDict[Tuple[str, ...], Image.Image]",
+        classes: List[str],
+        background: Callable[[], Image.Image]
+    ) -> Image.Image:
+        """
+        Return a background with class banners, cached per class combination.
+        
+        Banners can overlap, so the key keeps the display order. Composites
+        are kept in a small LRU of BANNER_BASE_CACHE_SIZE entries.
+        
+        Args:
+            cache: LRU of composites for one card side
+            classes: Class names in display order
+            background: Returns the shared background to copy
+            
+        Returns:
+            Composite for the class combination (shared, do not modify)
+        """
+        key = tuple(classes)
+        base = cache.get(key)
+        if base is None:
+            base = background().copy()
+            self._paste_class_banners(base, classes)
+            cache[key] = base
+            if len(cache) > self.BANNER_BASE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return base
+    
+    def _save_card(self, card: Image.Image, output_path: Path) -> None:
+        """
+        Save card as PNG, encoding in memory and writing the file in one call.
+        
+        Args:
+            card: Card image to save
+            output_path: Path to save card image
+        """
+        buffer = io.BytesIO()
+        card.save(buffer, "PNG", compress_level=self.png_compress_level)
+        Path(output_path).write_bytes(buffer.getbuffer())
+    
     def generate_card_front(
         self,
         spell: SpellData,
-        output_path: Path
+        output_path: Optional[Path] = None
     ) -> Image.Image:
         """
         Generate front side of spell card.
         
         Args:
             spell: Spell data
-            output_path: Path to save card image
+            output_path: Path to save card image (None to skip saving)
             
         Returns:
             Generated card image
         """
-        # Load background
-        card = self._load_image(self.assets.front_background)
-        
-        # Add illustration if available
+        # Add illustration if available (it sits between background and frame)
         if spell.illustration_path and spell.illustration_path.exists():
-            illustration = self._load_image(spell.illustration_path)
-            # Resize to fit illustration area (477x477 based on v1)
-            illustration = illustration.resize((477, 477), Image.Resampling.LANCZOS)
+            card = self._load_asset(self.assets.front_background).copy()
+            illustration = self._load_illustration(spell.illustration_path)
             self._paste_with_alpha(card, illustration, (138, 230))
-        
-        # Add front frame overlay
-        frame = self._load_image(self.assets.front_frame)
-        self._paste_with_alpha(card, frame)
-        
-        # Add class banners
-        for class_name in spell.classes:
-            if class_name in self.assets.class_banners:
-                banner_path = self.assets.class_banners[class_name]
-                if banner_path.exists():
-                    banner = self._load_image(banner_path)
-                    self._paste_with_alpha(card, banner)
+            
+            # Add front frame overlay
+            self._paste_overlay(card, self.assets.front_frame)
+            
+            # Add class banners
+            self._paste_class_banners(card, spell.classes)
+        else:
+            # Background with frame and class banners (shared by spells
+            # with the same classes)
+            card = self._get_front_base(spell.classes).copy()
         
         # Add spell name banner with text
-        spell_banner = self._load_image(self.assets.spell_banner).copy()
-        self.text_renderer.render_text_centered(
-            spell_banner,
-            spell.name,
-            center=(spell_banner.width // 2, 145),
-            max_width=spell_banner.width - 80,
-            max_height=90,
-            max_font_size=36,
-            color="black"
-        )
-        self._paste_with_alpha(card, spell_banner)
+        self._paste_with_alpha(card, self._render_spell_banner(spell.name))
         
         # Add spell level
         self.text_renderer.render_text_centered(
@@ -148,47 +471,30 @@ class CardGenerator:
         )
         
         # Save card
-        card.save(output_path)
+        if output_path is not None:
+            self._save_card(card, output_path)
         return card
     
     def generate_card_back(
         self,
         spell: SpellData,
-        output_path: Path
+        output_path: Optional[Path] = None
     ) -> Image.Image:
         """
         Generate back side of spell card.
         
         Args:
             spell: Spell data
-            output_path: Path to save card image
+            output_path: Path to save card image (None to skip saving)
             
         Returns:
             Generated card image
         """
-        # Load background
-        card = self._load_image(self.assets.back_background)
-        
-        # Add class banners
-        for class_name in spell.classes:
-            if class_name in self.assets.class_banners:
-                banner_path = self.assets.class_banners[class_name]
-                if banner_path.exists():
-                    banner = self._load_image(banner_path)
-                    self._paste_with_alpha(card, banner)
+        # Background with class banners (shared by spells with the same classes)
+        card = self._get_back_base(spell.classes).copy()
         
         # Add spell name banner with text
-        spell_banner = self._load_image(self.assets.spell_banner).copy()
-        self.text_renderer.render_text_centered(
-            spell_banner,
-            spell.name,
-            center=(spell_banner.width // 2, 145),
-            max_width=spell_banner.width - 80,
-            max_height=90,
-            max_font_size=36,
-            color="black"
-        )
-        self._paste_with_alpha(card, spell_banner)
+        self._paste_with_alpha(card, self._render_spell_banner(spell.name))
         
         # Add info box with structured stats
         # Filter classes to only valid ones
@@ -247,5 +553,6 @@ class CardGenerator:
         )
         
         # Save card
-        card.save(output_path)
+        if output_path is not None:
+            self._save_card(card, output_path)
         return card
@@ -5,19 +5,31 @@ from CSV data.
 """
 
 import argparse
+import os
+import re
 import sys
+import traceback
+from collections import OrderedDict
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Mapping, Optional
+
+import PIL
 
 from .data_loader import load_spell_data, load_assets
-from .card_generator import CardGenerator
-from .batch_processor import BatchProcessor
-from .pdf_generator import (
-    PDFGenerator,
-    SingleCardPDFGenerator,
-    CutReadyPDFGenerator,
-    GridConfig
-)
+from .models import RESIZE_QUALITIES
+
+# The rendering and PDF modules pull in Pillow's imaging core, reportlab
+# and multiprocessing; they are imported where they are first used so that
+# --help, --version and argument errors return immediately
+if TYPE_CHECKING:
+    from .batch_processor import BatchProcessor
+
+
+# ROWSxCOLS, e.g. 3x3 (signs are accepted so that "-1x3" gets the
+# more helpful range error)
+_GRID_PATTERN = re.compile(r'\s*([+-]?\d+)\s*x\s*([+-]?\d+)\s*', re.IGNORECASE)
 
 
 class SpellCardCLI:
@@ -148,6 +160,26 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
             help='Gap between cards in points (default: 10 for grid, 5 for cut-ready)'
         )
         
+        # Processing options
+        processing_group = parser.add_argument_group('processing options')
+        processing_group.add_argument(
+            '--workers',
+            type=self._parse_workers,
+            default=os.cpu_count() or 1,
+            metavar='N',
+            help='Worker processes for card rendering (default: CPU count, 1 = no pool)'
+        )
+        processing_group.add_argument(
+            '--resize-quality',
+            choices=list(RESIZE_QUALITIES),
+            default='best',
+            metavar='QUALITY',
+            help='''Illustration resize quality (default: best)
+  fast     - Bilinear filtering
+  balanced - Bicubic for near-size sources, LANCZOS otherwise
+  best     - Always LANCZOS'''
+        )
+        
         # Display options
         display_group = parser.add_argument_group('display options')
         display_group.add_argument(
@@ -202,7 +234,6 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
         except Exception as e:
             print(f"Error: {e}", file=sys.stderr)
             if parsed_args.verbose:
-                import traceback
                 traceback.print_exc()
             return 1
     
@@ -255,12 +286,18 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
         
         if not args.quiet:
             print("   ✅ Assets loaded successfully")
+        if args.verbose:
+            # Shows whether a SIMD build (version suffix .postN) is in use
+            print(f"   Pillow {PIL.__version__}")
         
-        # Generate card images
-        if not args.quiet:
-            print(f"\n🃏 Generating card images...")
+        from .batch_processor import BatchProcessor
+        from .card_generator import CardGenerator
         
-        generator = CardGenerator(assets)
+        generator = CardGenerator(assets, resize_quality=args.resize_quality)
+        
+        # Cards that only feed the PDF are handed over in memory instead of
+        # being written as PNG files, read back and deleted again
+        in_memory = not args.no_pdf and not args.keep_images
         
         # Setup progress callback
         progress_callback = None
@@ -272,50 +309,58 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
                 if current % 10 == 0 or current == total:
                     print(f"   Progress: {current}/{total} ({current*100//total}%)")
         
-        processor = BatchProcessor(generator, args.output, progress_callback=progress_callback)
-        results = processor.process_spells(spells)
-        
-        # Report results
-        summary = processor.get_summary(results)
-        if not args.quiet:
-            print(f"   ✅ Generated {summary['successful']} cards")
-            if summary['failed'] > 0:
-                print(f"   ⚠️  {summary['failed']} cards failed")
+        processor = BatchProcessor(
+            generator,
+            args.output,
+            progress_callback=progress_callback,
+            max_workers=args.workers,
+            in_memory=in_memory
+        )
         
-        # Generate PDF if requested
-        if not args.no_pdf:
+        if args.no_pdf:
+            # Generate card images only
             if not args.quiet:
-                print(f"\n📄 Generating PDF ({args.pdf_mode} mode)...")
+                print(f"\n🃏 Generating card images...")
+            results = processor.process_spells(spells)
+            self._report_cards(args, processor, results)
+        else:
+            # Build the PDF while the cards are rendered: each card name is
+            # handed to the PDF generator as soon as its images are ready
+            if not args.quiet:
+                print(f"\n🃏 Generating card images and PDF ({args.pdf_mode} mode)...")
+            results = {}
+            images = OrderedDict() if in_memory else None
+            
+            def rendered_card_names():
+                for result in processor.iter_results(spells):
+                    if images is not None:
+                        # A page's images are only read while that page is
+                        # drawn, so just the most recent pages are kept
+                        if result.success:
+                            images[result.spell_name] = (result.front_image, result.back_image)
+                            images.move_to_end(result.spell_name)
+                            while len(images) > keep:
+                                images.popitem(last=False)
+                        result = replace(result, front_image=None, back_image=None)
+                    results[result.spell_name] = result
+                    yield result.spell_name
             
             try:
-                pdf_path = self._generate_pdf(args, spells, args.output)
+                keep = 2 * self._cards_per_page(args)
+                pdf_path = self._generate_pdf(
+                    args, rendered_card_names(), args.output, images=images
+                )
+                self._report_cards(args, processor, results)
                 if not args.quiet:
                     print(f"   ✅ PDF created: {pdf_path}")
-                
-                # Cleanup PNG files unless --keep-images is specified
-                if not args.keep_images:
-                    if not args.quiet:
-                        print(f"\n🧹 Cleaning up intermediate PNG files...")
-                    
-                    try:
-                        cleanup_count = self._cleanup_png_files(args.output, spells)
-                        if not args.quiet:
-                            print(f"   ✅ Removed {cleanup_count} PNG files")
-                    except Exception as e:
-                        # Don't fail the operation if cleanup fails
-                        if not args.quiet:
-                            print(f"   ⚠️  Cleanup warning: {e}")
-                        if args.verbose:
-                            import traceback
-                            traceback.print_exc()
-                
             except Exception as e:
                 print(f"Error generating PDF: {e}", file=sys.stderr)
                 if args.verbose:
-                    import traceback
                     traceback.print_exc()
                 return 1
         
+        summary = processor.get_summary(results)
+        
         # Final summary
         if not args.quiet:
             print("\n" + "="*80)
@@ -327,24 +372,69 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
                 if args.keep_images:
                     print(f"🃏 Card images: {summary['successful'] * 2} files (preserved)")
                 else:
-                    print(f"🃏 Card images: Cleaned up (use --keep-images to preserve)")
+                    print(f"🃏 Card images: Not saved (use --keep-images to preserve)")
             else:
                 print(f"🃏 Card images: {summary['successful'] * 2} files")
         
         return 0
     
-    def _generate_pdf(self, args, spells, output_dir: Path) -> Path:
+    @staticmethod
+    def _report_cards(args, processor: "BatchProcessor", results) -> None:
+        """Print how many card images were generated.
+        
+        Args:
+            args: Parsed arguments
+            processor: Batch processor that produced the results
+            results: Processing results by spell name
+        """
+        summary = processor.get_summary(results)
+        if not args.quiet:
+            print(f"   ✅ Generated {summary['successful']} cards")
+            if summary['failed'] > 0:
+                print(f"   ⚠️  {summary['failed']} cards failed")
+    
+    @classmethod
+    def _cards_per_page(cls, args) -> int:
+        """Return the number of cards on one page of the selected PDF mode.
+        
+        Args:
+            args: Parsed arguments
+            
+        Returns:
+            Cards per page (1 for single-card mode)
+        """
+        if args.pdf_mode == 'single-card':
+            return 1
+        rows, cols = cls._parse_grid(args.grid)
+        return rows * cols
+    
+    def _generate_pdf(
+        self,
+        args,
+        card_names: Iterable[str],
+        output_dir: Path,
+        images: Optional[Mapping] = None
+    ) -> Path:
         """Generate PDF based on selected mode.
         
         Args:
             args: Parsed arguments
-            spells: List of spell data
+            card_names: Card names in order; may be produced lazily while
+                the card images are being written
             output_dir: Output directory
+            images: Optional in-memory (front, back) images per card name,
+                filled as card_names is consumed (read from output_dir if
+                omitted)
             
         Returns:
             Path to generated PDF file
         """
-        card_names = [spell.name for spell in spells]
+        from .pdf_generator import (
+            PDFGenerator,
+            SingleCardPDFGenerator,
+            CutReadyPDFGenerator,
+            GridConfig
+        )
         
         # Determine PDF filename
         if args.pdf_name:
@@ -357,7 +447,7 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
         if args.pdf_mode == 'single-card':
             # Single-card A7 mode
             generator = SingleCardPDFGenerator()
-            result = generator.generate_pdf(card_names, pdf_path, output_dir)
+            result = generator.generate_pdf(card_names, pdf_path, output_dir, images=images)
             
             if args.verbose:
                 print(f"   Pages: {result['total_pages']}")
@@ -390,7 +480,7 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
             else:
                 generator = PDFGenerator(config)
             
-            result = generator.generate_pdf(card_names, pdf_path, output_dir)
+            result = generator.generate_pdf(card_names, pdf_path, output_dir, images=images)
             
             if args.verbose:
                 print(f"   Grid: {rows}×{cols} {args.orientation}")
@@ -401,6 +491,7 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
         return pdf_path
     
     @staticmethod
+    @lru_cache(maxsize=32)
     def _parse_grid(grid_str: str) -> tuple:
         """Parse grid string like '3x3' into (rows, cols).
         
@@ -413,58 +504,42 @@ For more information, visit: https://github.com/yourusername/dnd-spell-cards
         Raises:
             ValueError: If grid string is invalid
         """
-        try:
-            parts = grid_str.lower().split('x')
-            if len(parts) != 2:
-                raise ValueError("Grid must be in format ROWSxCOLS (e.g., 3x3)")
-            
-            rows = int(parts[0])
-            cols = int(parts[1])
-            
-            if rows < 1 or cols < 1:
-                raise ValueError("Rows and columns must be at least 1")
-            
-            return rows, cols
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Invalid grid format '{grid_str}': {e}")
+        match = _GRID_PATTERN.fullmatch(grid_str)
+        if match is None:
+            raise ValueError(
+                f"Invalid grid format '{grid_str}': "
+                "Grid must be in format ROWSxCOLS (e.g., 3x3)"
+            )
+        
+        rows, cols = int(match.group(1)), int(match.group(2))
+        if rows < 1 or cols < 1:
+            raise ValueError(
+                f"Invalid grid format '{grid_str}': "
+                "Rows and columns must be at least 1"
+            )
+        
+        return rows, cols
     
     @staticmethod
-    def _cleanup_png_files(output_dir: Path, spells) -> int:
-        """Clean up intermediate PNG files after PDF generation.
+    def _parse_workers(value: str) -> int:
+        """Parse the --workers value (a positive integer).
         
         Args:
-            output_dir: Directory containing PNG files
-            spells: List of spell data
+            value: Command-line value
             
         Returns:
-            Number of files deleted
+            Number of worker processes
             
         Raises:
-            Exception: If cleanup fails
+            argparse.ArgumentTypeError: If value is not a positive integer
         """
-        import os
-        
-        deleted_count = 0
-        
-        for spell in spells:
-            # Sanitize filename (same logic as batch processor)
-            sanitized_name = spell.name.lower().replace("'", "").replace(" ", "_")
-            sanitized_name = "".join(c for c in sanitized_name if c.isalnum() or c == "_")
-            
-            # Delete front and back PNG files
-            front_file = output_dir / f"{sanitized_name}_front.png"
-            back_file = output_dir / f"{sanitized_name}_back.png"
-            
-            for file_path in [front_file, back_file]:
-                if file_path.exists():
-                    try:
-                        os.remove(file_path)
-                        deleted_count += 1
-                    except Exception as e:
-                        # Log but continue with other files
-                        raise Exception(f"Failed to delete {file_path}: {e}")
-        
-        return deleted_count
+        try:
+            workers = int(value)
+        except ValueError:
+            workers = 0
+        if workers < 1:
+            raise argparse.ArgumentTypeError(f"must be a positive integer, got '{value}'")
+        return workers
 
 
 def main():
@@ -1,16 +1,23 @@
 """Data loading and validation for spell card generator."""
 
 import csv
+import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 from .models import SpellData, AssetCollection
 
 
+# Illustration file extensions, in lookup priority order
+ILLUSTRATION_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+
 # Known D&D 5e classes
-VALID_CLASSES = {
+VALID_CLASSES = frozenset({
     "Artificer", "Barbarian", "Bard", "Cleric", "Druid", "Fighter",
     "Monk", "Paladin", "Ranger", "Rogue", "Sorcerer", "Warlock", "Wizard"
-}
+})
+
+# Class banner filename per class ("Wizard" -> "wizard.png")
+_BANNER_NAMES = {class_name: f"{class_name.lower()}.png" for class_name in VALID_CLASSES}
 
 
 class DataLoadError(Exception):
@@ -29,13 +36,44 @@ def load_spell_data(csv_path: Path, illustration_dir: Optional[Path] = None) ->
     Returns:
         List of SpellData objects
         
+    Raises:
+        DataLoadError: If CSV is invalid or required fields are missing
+    """
+    spells = list(iter_spell_data(csv_path, illustration_dir))
+    
+    if not spells:
+        raise DataLoadError("No valid spells found in CSV")
+    
+    return spells
+
+
+def iter_spell_data(
+    csv_path: Path,
+    illustration_dir: Optional[Path] = None
+) -> Iterator[SpellData]:
+    """
+    Parse spell data from CSV file one row at a time.
+    
+    Like load_spell_data, but yields each spell as its row is parsed, so
+    large files can be processed without holding every spell in memory.
+    Errors are raised when the offending row is reached.
+    
+    Args:
+        csv_path: Path to CSV file with spell data
+        illustration_dir: Optional directory containing illustration images
+        
+    Yields:
+        SpellData objects in file order
+        
     Raises:
         DataLoadError: If CSV is invalid or required fields are missing
     """
     if not csv_path.exists():
         raise DataLoadError(f"CSV file not found: {csv_path}")
     
-    spells = []
+    # List the illustration directory once instead of probing per spell
+    illustrations = _index_illustrations(illustration_dir) if illustration_dir else None
+    
     required_fields = {
         "Name", "Level", "Casting Time", "Duration", "Range", 
         "Components", "Classes", "Text"
@@ -43,92 +81,148 @@ def load_spell_data(csv_path: Path, illustration_dir: Optional[Path] = None) ->
     
     try:
         with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            # Plain rows plus a header index, instead of DictReader's
+            # per-row dict
+            reader = csv.reader(f)
+            fieldnames = next(reader, None)
             
             # Validate headers
-            if not reader.fieldnames:
+            if not fieldnames:
                 raise DataLoadError("CSV file is empty or has no headers")
             
-            missing_fields = required_fields - set(reader.fieldnames)
+            missing_fields = required_fields - set(fieldnames)
             if missing_fields:
                 raise DataLoadError(
                     f"Missing required CSV columns: {', '.join(missing_fields)}"
                 )
             
-            # Parse each spell
-            for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
+            # Last occurrence wins for duplicate headers, as with DictReader
+            column = {field: index for index, field in enumerate(fieldnames)}
+            name_col = column["Name"]
+            level_col = column["Level"]
+            casting_time_col = column["Casting Time"]
+            duration_col = column["Duration"]
+            range_col = column["Range"]
+            components_col = column["Components"]
+            classes_col = column["Classes"]
+            text_col = column["Text"]
+            higher_levels_col = column.get("At Higher Levels")
+            
+            # Unknown class names already warned about
+            reported_classes = set()
+            
+            # Parse each spell (blank lines are skipped, as with DictReader)
+            rows = (row for row in reader if row)
+            for row_num, row in enumerate(rows, start=2):  # Start at 2 (header is row 1)
                 try:
                     # Parse classes
-                    classes_str = row["Classes"].strip()
+                    classes_str = row[classes_col].strip()
                     if not classes_str:
                         raise ValueError("Classes field is empty")
                     
-                    classes = [c.strip() for c in classes_str.split(",")]
+                    classes = list(map(str.strip, classes_str.split(",")))
                     
-                    # Validate class names
-                    invalid_classes = [c for c in classes if c not in VALID_CLASSES]
-                    if invalid_classes:
-                        print(f"Warning: Row {row_num} - Unknown classes: {', '.join(invalid_classes)}")
+                    # Validate class names, warning about each unknown class
+                    # once (at the first row it appears in)
+                    if not VALID_CLASSES.issuperset(classes):
+                        invalid_classes = [
+                            c for c in dict.fromkeys(classes)
+                            if c not in VALID_CLASSES and c not in reported_classes
+                        ]
+                        if invalid_classes:
+                            reported_classes.update(invalid_classes)
+                            print(f"Warning: Row {row_num} - Unknown classes: {', '.join(invalid_classes)}")
                     
                     # Find illustration if directory provided
                     illustration_path = None
                     if illustration_dir:
-                        illustration_path = find_illustration(row["Name"], illustration_dir)
+                        illustration_path = find_illustration(
+                            row[name_col], illustration_dir, illustrations
+                        )
+                    
+                    at_higher_levels = None
+                    if higher_levels_col is not None and higher_levels_col < len(row):
+                        at_higher_levels = row[higher_levels_col].strip() or None
                     
                     # Create spell data
                     spell = SpellData(
-                        name=row["Name"].strip(),
-                        level=row["Level"].strip(),
-                        casting_time=row["Casting Time"].strip(),
-                        duration=row["Duration"].strip(),
-                        range=row["Range"].strip(),
-                        components=row["Components"].strip(),
+                        name=row[name_col].strip(),
+                        level=row[level_col].strip(),
+                        casting_time=row[casting_time_col].strip(),
+                        duration=row[duration_col].strip(),
+                        range=row[range_col].strip(),
+                        components=row[components_col].strip(),
                         classes=classes,
-                        description=row["Text"].strip(),
-                        at_higher_levels=row.get("At Higher Levels", "").strip() or None,
+                        description=row[text_col].strip(),
+                        at_higher_levels=at_higher_levels,
                         illustration_path=illustration_path
                     )
-                    
-                    spells.append(spell)
-                    
                 except Exception as e:
                     raise DataLoadError(f"Error parsing row {row_num}: {e}")
+                
+                yield spell
     
     except csv.Error as e:
         raise DataLoadError(f"CSV parsing error: {e}")
     except UnicodeDecodeError as e:
         raise DataLoadError(f"File encoding error: {e}")
+
+
+def _index_illustrations(illustration_dir: Path) -> Dict[str, Path]:
+    """
+    List the files of an illustration directory in a single scan.
     
-    if not spells:
-        raise DataLoadError("No valid spells found in CSV")
+    Callers scan once per batch (see iter_spell_data) and pass the index
+    to find_illustration, instead of probing the directory per spell.
     
-    return spells
+    Args:
+        illustration_dir: Directory containing illustration images
+        
+    Returns:
+        Mapping of lowercase filename to illustration path (empty if the
+        directory does not exist)
+    """
+    try:
+        with os.scandir(illustration_dir) as entries:
+            return {
+                entry.name.lower(): illustration_dir / entry.name
+                for entry in entries
+                if entry.is_file()
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
 
 
-def find_illustration(spell_name: str, illustration_dir: Path) -> Optional[Path]:
+def find_illustration(
+    spell_name: str,
+    illustration_dir: Path,
+    illustrations: Optional[Dict[str, Path]] = None
+) -> Optional[Path]:
     """
     Find illustration file for a spell.
     
     Looks for files matching the spell name (lowercase, spaces replaced with underscores)
-    with common image extensions.
+    with common image extensions. Filenames are matched case-insensitively.
     
     Args:
         spell_name: Name of the spell
         illustration_dir: Directory to search for illustrations
+        illustrations: Optional index from _index_illustrations(), to avoid
+            rescanning the directory for every spell
         
     Returns:
         Path to illustration file if found, None otherwise
     """
-    if not illustration_dir.exists():
-        return None
+    if illustrations is None:
+        illustrations = _index_illustrations(illustration_dir)
     
     # Convert spell name to filename format
     filename_base = spell_name.lower().replace(" ", "_")
     
     # Try common image extensions
-    for ext in [".jpg", ".jpeg", ".png", ".webp"]:
-        illustration_path = illustration_dir / f"{filename_base}{ext}"
-        if illustration_path.exists():
+    for ext in ILLUSTRATION_EXTENSIONS:
+        illustration_path = illustrations.get(f"{filename_base}{ext}")
+        if illustration_path is not None:
             return illustration_path
     
     return None
@@ -155,9 +249,8 @@ def load_assets(asset_dir: Path) -> AssetCollection:
     banner_dir = asset_dir / "class_banners"
     
     if banner_dir.exists():
-        for class_name in VALID_CLASSES:
-            banner_path = banner_dir / f"{class_name.lower()}.png"
-            class_banners[class_name] = banner_path
+        for class_name, banner_name in _BANNER_NAMES.items():
+            class_banners[class_name] = banner_dir / banner_name
     
     # Find font file
     font_dir = asset_dir / "fonts"
@@ -5,6 +5,30 @@ from typing import Optional, List
 from pathlib import Path
 
 
+# Spaces become underscores; characters unsafe in filenames are dropped
+_FILENAME_TRANSLATION = str.maketrans({" ": "_", **{c: None for c in '<>:"/\\|?*\''}})
+
+
+# Illustration resize quality levels (see CardGenerator.RESIZE_QUALITIES).
+# Defined here so the CLI can offer them without importing the renderer
+RESIZE_QUALITIES = ("fast", "balanced", "best")
+
+
+# Ordinal suffixes stripped from spell levels ("3rd" -> "3")
+_ORDINAL_SUFFIXES = ("st", "nd", "rd", "th")
+
+# Numeric form of the standard spell levels
+_LEVEL_NUMBERS = {
+    "Cantrip": "0", "1st": "1", "2nd": "2", "3rd": "3", "4th": "4",
+    "5th": "5", "6th": "6", "7th": "7", "8th": "8", "9th": "9"
+}
+
+
+def sanitize_filename(name: str) -> str:
+    """Convert a spell name to a safe, lowercase filename base."""
+    return name.translate(_FILENAME_TRANSLATION).lower()
+
+
 @dataclass
 class SpellData:
     """Represents a D&D spell with all its properties."""
@@ -20,6 +44,11 @@ class SpellData:
     at_higher_levels: Optional[str] = None
     illustration_path: Optional[Path] = None
     
+    @property
+    def safe_name(self) -> str:
+        """Return the sanitized filename base for this spell's card images."""
+        return sanitize_filename(self.name)
+    
     @property
     def components_short(self) -> str:
         """Return simplified component string (V, S, M only, no materials)."""
@@ -30,12 +59,12 @@ class SpellData:
     @property
     def level_numeric(self) -> str:
         """Return numeric level (0 for Cantrip, strip ordinal suffixes)."""
-        if self.level == "Cantrip":
-            return "0"
+        numeric = _LEVEL_NUMBERS.get(self.level)
+        if numeric is not None:
+            return numeric
         # Remove ordinal suffixes (st, nd, rd, th)
-        for suffix in ["st", "nd", "rd", "th"]:
-            if self.level.endswith(suffix):
-                return self.level[:-2]
+        if self.level.endswith(_ORDINAL_SUFFIXES):
+            return self.level[:-2]
         return self.level
 
 
@@ -10,17 +10,316 @@ All modes handle double-sided alignment to ensure fronts and backs align
 correctly when printed.
 """
 
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Set, Tuple, Optional, Union
 from dataclasses import dataclass
+from PIL import Image
 from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.canvas import FILL_NON_ZERO
 from reportlab.lib.units import mm
+from .models import sanitize_filename
 
 
-@dataclass
+# In-memory card image: a PIL image, or an ImageReader that keeps its
+# converted pixel data for reuse across draws
+CardImage = Union[Image.Image, ImageReader]
+
+# In-memory card images: card name -> (front image, back image)
+CardImages = Dict[str, Tuple[Optional[CardImage], Optional[CardImage]]]
+
+
+def _without_alpha(image: Image.Image) -> Image.Image:
+    """Drop the alpha channel of a card image before handing it to ReportLab.
+    
+    Cards are drawn without a mask, so ReportLab discards the alpha anyway,
+    but only after splitting it off into a separate reader for every image.
+    """
+    if image.mode == "RGBA":
+        return image.convert("RGB")
+    return image
+
+
+def _as_image_reader(image: Optional[CardImage]) -> Optional[ImageReader]:
+    """Wrap a PIL image in an ImageReader (readers and None pass through)."""
+    if image is None or isinstance(image, ImageReader):
+        return image
+    return ImageReader(_without_alpha(image))
+
+
+def _list_image_files(image_dir: Path) -> Set[str]:
+    """List the file names in an image directory in a single scan.
+    
+    Args:
+        image_dir: Directory containing card images
+    
+    Returns:
+        Set of file names (empty if the directory does not exist)
+    """
+    try:
+        with os.scandir(image_dir) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+
+def _card_image_source(
+    card_name: str,
+    side: str,
+    image_path: str,
+    images: Optional[CardImages]
+) -> Optional[Union[str, ImageReader]]:
+    """Pick what to draw for one side of a card.
+    
+    Args:
+        card_name: Card base name
+        side: "front" or "back"
+        image_path: Path of the card image on disk
+        images: Optional in-memory card images (used instead of files)
+    
+    Returns:
+        ImageReader for an in-memory image, the file path for an image on
+        disk (ReportLab embeds each file path once per document), or None
+        if the image is missing
+    """
+    if images is not None:
+        card_images = images.get(card_name)
+        if card_images is None:
+            return None
+        return _as_image_reader(card_images[0] if side == "front" else card_images[1])
+    
+    if not os.path.exists(image_path):
+        return None
+    return image_path
+
+
+def _iter_page_groups(
+    card_names: Iterable[str],
+    cards_per_page: int
+) -> Iterator[List[Optional[str]]]:
+    """Yield card names one page at a time.
+    
+    Names are pulled from card_names lazily, so a generator works and only
+    one page of names is held at a time.
+    
+    Args:
+        card_names: Card base names
+        cards_per_page: Number of slots per page
+    
+    Yields:
+        Card names of one page, padded with None if incomplete
+    """
+    names = iter(card_names)
+    while True:
+        group: List[Optional[str]] = list(islice(names, cards_per_page))
+        if not group:
+            return
+        # Pad last group with None if incomplete
+        if len(group) < cards_per_page:
+            group.extend([None] * (cards_per_page - len(group)))
+        yield group
+
+
+def _filled_slots(
+    group: List[Optional[str]],
+    slots: List[Tuple[int, Tuple[float, float]]]
+) -> List[Tuple[str, Tuple[float, float]]]:
+    """Pick the slots of a page that hold a card.
+    
+    Args:
+        group: Card names of the page (or None for empty slots)
+        slots: (card index in group, (x, y)) per position
+    
+    Returns:
+        (card name, (x, y)) for each filled slot, in slot order
+    """
+    return [(group[idx], pos) for idx, pos in slots if group[idx] is not None]
+
+
+def _decode_card_image(image_path: str) -> ImageReader:
+    """Open and decode a card image so drawing it needs no further decoding."""
+    # Images are embedded at their source resolution on purpose: the cards
+    # are flat artwork that Flate-compresses very well, and resampling them
+    # to a target DPI adds detail that makes the PDF larger, not smaller
+    with Image.open(image_path) as image:
+        image.load()
+        reader = ImageReader(_without_alpha(image))
+    reader.getRGBData()
+    return reader
+
+
+def _prefetch_card_images(
+    groups: Iterable[List[Optional[str]]],
+    image_dir: Path
+) -> Iterator[Tuple[List[Optional[str]], CardImages]]:
+    """Decode the images of each page in background threads.
+    
+    While a page is being drawn, the images of the next page are already
+    being decoded, so at most two pages of images are held in memory.
+    Within those two pages each image file is decoded once, whether it is
+    repeated by copies of a card or by names that map to the same file.
+    
+    Args:
+        groups: Card names per page (see _iter_page_groups)
+        image_dir: Directory containing card images
+    
+    Yields:
+        (group, images of the group); a side is None if its file is missing
+    """
+    image_files = _list_image_files(image_dir)
+    image_dir_str = os.fspath(image_dir)
+    
+    with ThreadPoolExecutor() as executor:
+        def submit(
+            group: List[Optional[str]],
+            recent: Dict[str, Optional[Future]]
+        ) -> Tuple[Dict[str, List[Optional[Future]]], Dict[str, Optional[Future]]]:
+            nonlocal image_files
+            refreshed = False
+            pending: Dict[str, List[Optional[Future]]] = {}
+            decodes: Dict[str, Optional[Future]] = {}
+            for card_name in group:
+                if card_name is None or card_name in pending:
+                    continue
+                safe_name = sanitize_filename(card_name)
+                sides = []
+                for filename in (f"{safe_name}_front.png", f"{safe_name}_back.png"):
+                    # Names that resolve to the same file share one decode
+                    if filename not in decodes and filename in recent:
+                        decodes[filename] = recent[filename]
+                    elif filename not in decodes:
+                        if filename not in image_files and not refreshed:
+                            # Card names may be produced while their images
+                            # are still being written, so list the directory
+                            # again (at most once per page) before giving up
+                            image_files = _list_image_files(image_dir)
+                            refreshed = True
+                        if filename in image_files:
+                            decodes[filename] = executor.submit(
+                                _decode_card_image, os.path.join(image_dir_str, filename)
+                            )
+                        else:
+                            decodes[filename] = None
+                    sides.append(decodes[filename])
+                pending[card_name] = sides
+            return pending, decodes
+        
+        groups = iter(groups)
+        group = next(groups, None)
+        pending, decodes = submit(group, {}) if group is not None else ({}, {})
+        while group is not None:
+            # Queue the next page before waiting on this one
+            next_group = next(groups, None)
+            next_pending, next_decodes = (
+                submit(next_group, decodes) if next_group is not None else ({}, {})
+            )
+            
+            images: CardImages = {
+                card_name: (
+                    front.result() if front is not None else None,
+                    back.result() if back is not None else None
+                )
+                for card_name, (front, back) in pending.items()
+            }
+            yield group, images
+            
+            group, pending, decodes = next_group, next_pending, next_decodes
+
+
+def load_card_images(card_names: Iterable[str], image_dir: Path) -> CardImages:
+    """Read and decode the front and back PNG of each card once.
+    
+    Args:
+        card_names: Card base names; any iterable
+        image_dir: Directory containing card images
+    
+    Returns:
+        In-memory card images; a side is None if its file is missing
+    """
+    images: CardImages = {}
+    for card_name in card_names:
+        safe_name = sanitize_filename(card_name)
+        sides = []
+        for side in ("front", "back"):
+            image_path = image_dir / f"{safe_name}_{side}.png"
+            if image_path.exists():
+                with Image.open(image_path) as image:
+                    image.load()
+                    sides.append(image)
+            else:
+                sides.append(None)
+        images[card_name] = (sides[0], sides[1])
+    return images
+
+
+def _generate_pdf_job(
+    generator: "PDFLayoutGenerator",
+    card_names: List[str],
+    output_path: Path,
+    image_dir: Path
+) -> dict:
+    """Run one generate_pdfs job (top-level so worker processes can pickle it)."""
+    return generator.generate_pdf(card_names, output_path, image_dir)
+
+
+def generate_pdfs(
+    jobs: List[Tuple["PDFLayoutGenerator", Path]],
+    card_names: Iterable[str],
+    image_dir: Path,
+    images: Optional[CardImages] = None,
+    max_workers: int = 1
+) -> List[dict]:
+    """Generate several PDFs of the same cards, decoding each image once.
+    
+    Args:
+        jobs: (generator, output path) pairs; any mix of layout modes
+        card_names: Card base names; any iterable (read once and reused
+            for every job)
+        image_dir: Directory containing card images
+        images: Optional in-memory card images; read from image_dir if omitted
+        max_workers: Number of worker processes. With more than one, each
+            PDF is built in its own process and reads the images from
+            image_dir itself; in-memory images are always used in-process.
+    
+    Returns:
+        Generation statistics of each job, in job order
+    """
+    # Every job walks the names again, so a one-shot iterator is kept
+    card_names = list(card_names)
+    
+    if max_workers > 1 and len(jobs) > 1 and images is None:
+        workers = min(max_workers, len(jobs))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _generate_pdf_job, generator, card_names, output_path, image_dir
+                )
+                for generator, output_path in jobs
+            ]
+            return [future.result() for future in futures]
+    
+    if images is None:
+        images = load_card_images(card_names, image_dir)
+    
+    # Wrap each image once so every PDF reuses the same converted pixel data
+    readers: CardImages = {
+        card_name: (_as_image_reader(front), _as_image_reader(back))
+        for card_name, (front, back) in images.items()
+    }
+    return [
+        generator.generate_pdf(card_names, output_path, image_dir, images=readers)
+        for generator, output_path in jobs
+    ]
+
+
+@dataclass(frozen=True)
 class GridConfig:
-    """Configuration for PDF grid layout."""
+    """Configuration for PDF grid layout (immutable, usable as a cache key)."""
     rows: int = 3
     cols: int = 3
     orientation: str = "portrait"  # "portrait" or "landscape"
@@ -36,11 +335,17 @@ class GridConfig:
             raise ValueError("Orientation must be 'portrait' or 'landscape'")
 
 
-class PDFGenerator:
-    """Generates PDF files with spell cards in grid layout."""
+class _GridPDFGenerator(ABC):
+    """Shared page setup and page loop of the grid-based layouts.
     
-    # Standard A7 card aspect ratio (portrait)
-    CARD_ASPECT_RATIO = 210 / 298
+    Subclasses provide the card size (_calculate_card_dimensions) and how
+    one page of cards is drawn (_draw_page).
+    """
+    
+    # Number of computed layouts kept per process, keyed by generator class
+    # and config (the same config is often reused for repeated generation)
+    LAYOUT_CACHE_SIZE = 32
+    _layout_cache: Dict[Tuple[type, GridConfig], tuple] = {}
     
     def __init__(self, config: GridConfig):
         """Initialize PDF generator with grid configuration.
@@ -49,11 +354,40 @@ class PDFGenerator:
             config: Grid layout configuration
         """
         self.config = config
+        
+        # Layout lists are shared between generators with the same config
+        # (do not modify)
+        key = (type(self), config)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            layout = self._compute_layout()
+            if len(self._layout_cache) >= self.LAYOUT_CACHE_SIZE:
+                self._layout_cache.pop(next(iter(self._layout_cache)))
+            self._layout_cache[key] = layout
+        
+        (
+            self.page_size,
+            (self.card_width, self.card_height),
+            self.positions,
+            self.back_order,
+            (self.front_slots, self.back_slots)
+        ) = layout
+        self.page_width, self.page_height = self.page_size
+    
+    def _compute_layout(self) -> tuple:
+        """Compute page size, card size, positions, back order and slots."""
         self.page_size = self._get_page_size()
         self.page_width, self.page_height = self.page_size
         self.card_width, self.card_height = self._calculate_card_dimensions()
         self.positions = self._calculate_positions()
         self.back_order = self._calculate_back_order()
+        return (
+            self.page_size,
+            (self.card_width, self.card_height),
+            self.positions,
+            self.back_order,
+            self._calculate_slots()
+        )
     
     def _get_page_size(self) -> Tuple[float, float]:
         """Get page size based on orientation.
@@ -65,36 +399,9 @@ class PDFGenerator:
             return landscape(A4)
         return A4
     
+    @abstractmethod
     def _calculate_card_dimensions(self) -> Tuple[float, float]:
-        """Calculate optimal card dimensions to fit the grid on the page.
-        
-        The algorithm:
-        1. Calculate available space after margins and gaps
-        2. Determine card width based on available width
-        3. Calculate card height from width using aspect ratio
-        4. If total height exceeds available space, scale down
-        
-        Returns:
-            Tuple of (card_width, card_height) in points
-        """
-        # Available space for the grid
-        avail_width = (self.page_width - 2 * self.config.margin - 
-                      (self.config.cols - 1) * self.config.gap_x)
-        avail_height = (self.page_height - 2 * self.config.margin - 
-                       (self.config.rows - 1) * self.config.gap_y)
-        
-        # Calculate card dimensions based on available width
-        card_width = avail_width / self.config.cols
-        card_height = card_width / self.CARD_ASPECT_RATIO
-        
-        # Check if height fits, scale down if needed
-        total_height = (card_height * self.config.rows + 
-                       (self.config.rows - 1) * self.config.gap_y)
-        if total_height > avail_height:
-            card_height = avail_height / self.config.rows
-            card_width = card_height * self.CARD_ASPECT_RATIO
-        
-        return card_width, card_height
+        """Return (card_width, card_height) in points."""
     
     def _calculate_positions(self) -> List[Tuple[float, float]]:
         """Calculate card positions in the grid.
@@ -115,15 +422,14 @@ class PDFGenerator:
         offset_x = (self.page_width - grid_width) / 2.0
         offset_y = (self.page_height - grid_height) / 2.0
         
-        # Calculate positions for each card
-        positions = []
-        for row in range(self.config.rows):
-            for col in range(self.config.cols):
-                x = offset_x + col * (self.card_width + self.config.gap_x)
-                y = offset_y + row * (self.card_height + self.config.gap_y)
-                positions.append((x, y))
+        # Column and row coordinates are shared by every card in them
+        xs = [offset_x + col * (self.card_width + self.config.gap_x)
+              for col in range(self.config.cols)]
+        ys = [offset_y + row * (self.card_height + self.config.gap_y)
+              for row in range(self.config.rows)]
         
-        return positions
+        # Calculate positions for each card
+        return [(x, y) for y in ys for x in xs]
     
     def _calculate_back_order(self) -> List[int]:
         """Calculate the order of cards on back pages for double-sided alignment.
@@ -139,28 +445,44 @@ class PDFGenerator:
         Returns:
             List of indices indicating the order for back pages
         """
-        back_order = []
-        for row in range(self.config.rows):
-            # Get indices for this row
-            row_start = row * self.config.cols
-            row_indices = list(range(row_start, row_start + self.config.cols))
-            # Reverse the row (horizontal mirror)
-            back_order.extend(reversed(row_indices))
+        cols = self.config.cols
+        # Each row reversed (horizontal mirror)
+        return [
+            row * cols + col
+            for row in range(self.config.rows)
+            for col in reversed(range(cols))
+        ]
+    
+    def _calculate_slots(
+        self
+    ) -> Tuple[List[Tuple[int, Tuple[float, float]]], List[Tuple[int, Tuple[float, float]]]]:
+        """Pair each position with the index of the card drawn there.
         
-        return back_order
+        Built once so page drawing needs no per-page reordering.
+        
+        Returns:
+            (front slots, back slots) as lists of (card index, (x, y))
+        """
+        front_slots = list(enumerate(self.positions))
+        back_slots = list(zip(self.back_order, self.positions))
+        return front_slots, back_slots
     
     def generate_pdf(
         self,
-        card_names: List[str],
+        card_names: Iterable[str],
         output_path: Path,
-        image_dir: Path
+        image_dir: Path,
+        images: Optional[CardImages] = None
     ) -> dict:
-        """Generate PDF with cards in grid layout.
+        """Generate PDF with cards laid out on front and back pages.
         
         Args:
-            card_names: List of card base names (without _front.png/_back.png)
+            card_names: Card base names (without _front.png/_back.png); any
+                iterable, consumed lazily page by page
             output_path: Path for output PDF file
             image_dir: Directory containing card images
+            images: Optional in-memory (front, back) images per card name,
+                used instead of reading PNG files from image_dir
         
         Returns:
             Dictionary with generation statistics:
@@ -170,106 +492,151 @@ class PDFGenerator:
         """
         cards_per_page = self.config.rows * self.config.cols
         missing_files = []
+        total_cards = 0
+        total_groups = 0
         
-        # Group cards into pages
-        groups = []
-        for i in range(0, len(card_names), cards_per_page):
-            group = card_names[i:i + cards_per_page]
-            # Pad last group with None if incomplete
-            if len(group) < cards_per_page:
-                group.extend([None] * (cards_per_page - len(group)))
-            groups.append(group)
+        # Group cards as they arrive; read from disk, each page's images are
+        # decoded in the background while the previous page is drawn
+        pages = _iter_page_groups(card_names, cards_per_page)
+        if images is None:
+            pages = _prefetch_card_images(pages, image_dir)
+        else:
+            pages = ((group, images) for group in pages)
         
         # Create PDF
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        c = canvas.Canvas(str(output_path), pagesize=self.page_size)
+        c = canvas.Canvas(
+            str(output_path), pagesize=self.page_size, pageCompression=1
+        )
         
         # Generate pages for each group
-        for group in groups:
+        for group, page_images in pages:
+            # Skip completely empty groups (all None)
+            filled_count = sum(card is not None for card in group)
+            if not filled_count:
+                continue
+            total_cards += filled_count
+            total_groups += 1
+            
             # Front page
-            self._draw_page(c, group, image_dir, "front", self.positions, missing_files)
+            self._draw_page(c, group, image_dir, "front", self.front_slots,
+                            missing_files, page_images)
             c.showPage()
             
             # Back page (with mirrored order)
-            self._draw_page(c, group, image_dir, "back", self.positions, missing_files, self.back_order)
+            self._draw_page(c, group, image_dir, "back", self.back_slots,
+                            missing_files, page_images)
             c.showPage()
         
         c.save()
         
         return {
-            "total_cards": len(card_names),
-            "total_pages": len(groups) * 2,
+            "total_cards": total_cards,
+            "total_pages": total_groups * 2,
             "missing_files": missing_files
         }
     
+    @abstractmethod
     def _draw_page(
         self,
         c: canvas.Canvas,
         group: List[Optional[str]],
         image_dir: Path,
         side: str,
-        positions: List[Tuple[float, float]],
+        slots: List[Tuple[int, Tuple[float, float]]],
         missing_files: List[str],
-        order: Optional[List[int]] = None
+        images: Optional[CardImages] = None
     ):
-        """Draw a single page with cards.
+        """Draw one side of a page of cards.
         
         Args:
             c: ReportLab canvas
             group: List of card names (or None for empty slots)
             image_dir: Directory containing card images
             side: "front" or "back"
-            positions: List of (x, y) positions
+            slots: (card index in group, (x, y)) per position
             missing_files: List to append missing file paths
-            order: Optional reordering of cards (for back pages)
+            images: Optional in-memory card images
         """
-        if order is None:
-            order = list(range(len(group)))
+
+
+class PDFGenerator(_GridPDFGenerator):
+    """Generates PDF files with spell cards in grid layout."""
+    
+    # Standard A7 card aspect ratio (portrait)
+    CARD_ASPECT_RATIO = 210 / 298
+    
+    def _calculate_card_dimensions(self) -> Tuple[float, float]:
+        """Calculate optimal card dimensions to fit the grid on the page.
         
-        for i, idx in enumerate(order):
-            card_name = group[idx]
-            if card_name is None:
-                continue
-            
+        The algorithm:
+        1. Calculate available space after margins and gaps
+        2. Determine card width based on available width
+        3. Calculate card height from width using aspect ratio
+        4. If total height exceeds available space, scale down
+        
+        Returns:
+            Tuple of (card_width, card_height) in points
+        """
+        # Available space for the grid
+        avail_width = (self.page_width - 2 * self.config.margin - 
+                      (self.config.cols - 1) * self.config.gap_x)
+        avail_height = (self.page_height - 2 * self.config.margin - 
+                       (self.config.rows - 1) * self.config.gap_y)
+        
+        # Calculate card dimensions based on available width
+        card_width = avail_width / self.config.cols
+        card_height = card_width / self.CARD_ASPECT_RATIO
+        
+        # Check if height fits, scale down if needed
+        total_height = (card_height * self.config.rows + 
+                       (self.config.rows - 1) * self.config.gap_y)
+        if total_height > avail_height:
+            card_height = avail_height / self.config.rows
+            card_width = card_height * self.CARD_ASPECT_RATIO
+        
+        return card_width, card_height
+    
+    def _draw_page(
+        self,
+        c: canvas.Canvas,
+        group: List[Optional[str]],
+        image_dir: Path,
+        side: str,
+        slots: List[Tuple[int, Tuple[float, float]]],
+        missing_files: List[str],
+        images: Optional[CardImages] = None
+    ):
+        """Draw a single page with cards.
+        
+        Args:
+            c: ReportLab canvas
+            group: List of card names (or None for empty slots)
+            image_dir: Directory containing card images
+            side: "front" or "back"
+            slots: (card index in group, (x, y)) per position; back pages
+                use the mirrored slots
+            missing_files: List to append missing file paths
+            images: Optional in-memory card images
+        """
+        image_dir_str = os.fspath(image_dir)
+        for card_name, (x, y) in _filled_slots(group, slots):
             # Sanitize filename to match batch processor output
-            safe_name = self._sanitize_filename(card_name)
-            image_path = image_dir / f"{safe_name}_{side}.png"
+            safe_name = sanitize_filename(card_name)
+            image_path = os.path.join(image_dir_str, f"{safe_name}_{side}.png")
             
-            if not image_path.exists():
-                missing_files.append(str(image_path))
+            source = _card_image_source(card_name, side, image_path, images)
+            if source is None:
+                missing_files.append(image_path)
                 continue
             
             # Draw image at position
-            pos = positions[i]
             c.drawImage(
-                str(image_path),
-                pos[0], pos[1],
+                source,
+                x, y,
                 width=self.card_width,
                 height=self.card_height
             )
-    
-    @staticmethod
-    def _sanitize_filename(name: str) -> str:
-        """Convert spell name to safe filename (matches batch processor logic).
-        
-        Args:
-            name: Spell name
-            
-        Returns:
-            Safe filename string
-        """
-        # Replace spaces with underscores
-        safe = name.replace(" ", "_")
-        
-        # Remove or replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*\''
-        for char in unsafe_chars:
-            safe = safe.replace(char, "")
-        
-        # Convert to lowercase
-        safe = safe.lower()
-        
-        return safe
 
 
 class SingleCardPDFGenerator:
@@ -284,15 +651,19 @@ class SingleCardPDFGenerator:
     A7_WIDTH = 210  # ~74.25mm
     A7_HEIGHT = 298  # ~105mm
     
+    # Cards decoded ahead in the background when reading from disk
+    PREFETCH_CARDS = 4
+    
     def __init__(self):
         """Initialize single-card PDF generator."""
         self.page_size = (self.A7_WIDTH, self.A7_HEIGHT)
     
     def generate_pdf(
         self,
-        card_names: List[str],
+        card_names: Iterable[str],
         output_path: Path,
-        image_dir: Path
+        image_dir: Path,
+        images: Optional[CardImages] = None
     ) -> dict:
         """Generate PDF with one card per A7 page.
         
@@ -301,9 +672,12 @@ class SingleCardPDFGenerator:
         - Page 2: Back of card
         
         Args:
-            card_names: List of card base names (without _front.png/_back.png)
+            card_names: Card base names (without _front.png/_back.png); any
+                iterable, consumed lazily page by page
             output_path: Path for output PDF file
             image_dir: Directory containing card images
+            images: Optional in-memory (front, back) images per card name,
+                used instead of reading PNG files from image_dir
         
         Returns:
             Dictionary with generation statistics:
@@ -312,75 +686,79 @@ class SingleCardPDFGenerator:
             - missing_files: List of missing image files
         """
         missing_files = []
+        total_cards = 0
+        
+        # Read from disk, the next few cards are decoded in the background
+        # while the current ones are drawn
+        if images is None:
+            batches = _prefetch_card_images(
+                _iter_page_groups(card_names, self.PREFETCH_CARDS), image_dir
+            )
+            cards = (
+                (card_name, batch_images)
+                for batch, batch_images in batches
+                for card_name in batch
+                if card_name is not None
+            )
+        else:
+            cards = ((card_name, images) for card_name in card_names)
         
         # Create PDF
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        c = canvas.Canvas(str(output_path), pagesize=self.page_size)
+        c = canvas.Canvas(
+            str(output_path), pagesize=self.page_size, pageCompression=1
+        )
         
         # Generate pages for each card (front, then back)
-        for card_name in card_names:
+        image_dir_str = os.fspath(image_dir)
+        for card_name, card_images in cards:
+            total_cards += 1
+            
             # Sanitize filename to match batch processor output
-            safe_name = self._sanitize_filename(card_name)
+            safe_name = sanitize_filename(card_name)
             
             # Front page
-            front_path = image_dir / f"{safe_name}_front.png"
-            if front_path.exists():
+            front_path = os.path.join(image_dir_str, f"{safe_name}_front.png")
+            front_source = _card_image_source(
+                card_name, "front", front_path, card_images
+            )
+            if front_source is not None:
                 c.drawImage(
-                    str(front_path),
+                    front_source,
                     0, 0,
                     width=self.A7_WIDTH,
                     height=self.A7_HEIGHT
                 )
             else:
-                missing_files.append(str(front_path))
+                missing_files.append(front_path)
             c.showPage()
             
             # Back page
-            back_path = image_dir / f"{safe_name}_back.png"
-            if back_path.exists():
+            back_path = os.path.join(image_dir_str, f"{safe_name}_back.png")
+            back_source = _card_image_source(
+                card_name, "back", back_path, card_images
+            )
+            if back_source is not None:
                 c.drawImage(
-                    str(back_path),
+                    back_source,
                     0, 0,
                     width=self.A7_WIDTH,
                     height=self.A7_HEIGHT
                 )
             else:
-                missing_files.append(str(back_path))
+                missing_files.append(back_path)
             c.showPage()
         
         c.save()
         
         return {
-            "total_cards": len(card_names),
-            "total_pages": len(card_names) * 2,
+            "total_cards": total_cards,
+            "total_pages": total_cards * 2,
             "missing_files": missing_files
         }
-    
-    @staticmethod
-    def _sanitize_filename(name: str) -> str:
-        """Convert spell name to safe filename (matches batch processor logic).
-        
-        Args:
-            name: Spell name
-            
-        Returns:
-            Safe filename string
-        """
-        # Replace spaces with underscores
-        safe = name.replace(" ", "_")
-        
-        # Remove or replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*\''
-        for char in unsafe_chars:
-            safe = safe.replace(char, "")
-        
-        # Convert to lowercase
-        safe = safe.lower()
-        
-        return safe
 
 
-class CutReadyPDFGenerator:
+class CutReadyPDFGenerator(_GridPDFGenerator):
     """Generates PDF with fixed card dimensions, cut guidelines, and bleed.
     
     This mode is designed for professional printing and cutting:
@@ -407,66 +785,19 @@ class CutReadyPDFGenerator:
         Args:
             config: Grid configuration (rows, cols, orientation)
         """
-        self.config = config
-        self.page_size = self._get_page_size()
-        self.page_width, self.page_height = self.page_size
-        
-        # Convert dimensions to points
-        self.card_width = self.CARD_WIDTH_MM * mm
-        self.card_height = self.CARD_HEIGHT_MM * mm
         self.bleed = self.BLEED_MM * mm
-        
-        # Calculate positions and validate fit
-        self.positions = self._calculate_positions()
-        self.back_order = self._calculate_back_order()
+        super().__init__(config)
         
         # Validate that grid fits on page
         self._validate_grid_fits()
     
-    def _get_page_size(self) -> Tuple[float, float]:
-        """Get page size based on orientation."""
-        if self.config.orientation == "landscape":
-            return landscape(A4)
-        return A4
-    
-    def _calculate_positions(self) -> List[Tuple[float, float]]:
-        """Calculate card positions with fixed dimensions.
+    def _calculate_card_dimensions(self) -> Tuple[float, float]:
+        """Return the fixed card dimensions in points.
         
         Unlike the grid layout which scales cards to fit, this uses fixed
-        card dimensions and calculates positions to center the grid.
-        """
-        # Calculate total grid size with fixed card dimensions
-        grid_width = (self.config.cols * self.card_width + 
-                     (self.config.cols - 1) * self.config.gap_x)
-        grid_height = (self.config.rows * self.card_height + 
-                      (self.config.rows - 1) * self.config.gap_y)
-        
-        # Center the grid on the page
-        offset_x = (self.page_width - grid_width) / 2.0
-        offset_y = (self.page_height - grid_height) / 2.0
-        
-        # Calculate positions for each card
-        positions = []
-        for row in range(self.config.rows):
-            for col in range(self.config.cols):
-                x = offset_x + col * (self.card_width + self.config.gap_x)
-                y = offset_y + row * (self.card_height + self.config.gap_y)
-                positions.append((x, y))
-        
-        return positions
-    
-    def _calculate_back_order(self) -> List[int]:
-        """Calculate the order of cards on back pages for double-sided alignment.
-        
-        Same as grid layout: each row is horizontally mirrored.
+        card dimensions; positions still center the grid on the page.
         """
-        back_order = []
-        for row in range(self.config.rows):
-            row_start = row * self.config.cols
-            row_indices = list(range(row_start, row_start + self.config.cols))
-            back_order.extend(reversed(row_indices))
-        
-        return back_order
+        return self.CARD_WIDTH_MM * mm, self.CARD_HEIGHT_MM * mm
     
     def _validate_grid_fits(self):
         """Validate that the grid with fixed card dimensions fits on the page.
@@ -491,75 +822,22 @@ class CutReadyPDFGenerator:
                 f"Available: {self.page_width:.1f}×{self.page_height:.1f}pt"
             )
     
-    def generate_pdf(
-        self,
-        card_names: List[str],
-        output_path: Path,
-        image_dir: Path
-    ) -> dict:
-        """Generate cut-ready PDF with guidelines and bleed.
-        
-        Args:
-            card_names: List of card base names
-            output_path: Path for output PDF file
-            image_dir: Directory containing card images
-        
-        Returns:
-            Dictionary with generation statistics
-        """
-        cards_per_page = self.config.rows * self.config.cols
-        missing_files = []
-        
-        # Group cards into pages
-        groups = []
-        for i in range(0, len(card_names), cards_per_page):
-            group = card_names[i:i + cards_per_page]
-            if len(group) < cards_per_page:
-                group.extend([None] * (cards_per_page - len(group)))
-            groups.append(group)
-        
-        # Create PDF
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        c = canvas.Canvas(str(output_path), pagesize=self.page_size)
-        
-        # Generate pages for each group
-        for group in groups:
-            # Skip completely empty groups (all None)
-            if all(card is None for card in group):
-                continue
-            
-            # Front page
-            self._draw_cut_ready_page(c, group, image_dir, "front", missing_files)
-            c.showPage()
-            
-            # Back page (with mirrored order)
-            self._draw_cut_ready_page(c, group, image_dir, "back", missing_files, use_back_order=True)
-            c.showPage()
-        
-        c.save()
-        
-        return {
-            "total_cards": len(card_names),
-            "total_pages": len(groups) * 2,
-            "missing_files": missing_files
-        }
-    
-    def _draw_cut_ready_page(
+    def _draw_page(
         self,
         c: canvas.Canvas,
         group: List[Optional[str]],
         image_dir: Path,
         side: str,
+        slots: List[Tuple[int, Tuple[float, float]]],
         missing_files: List[str],
-        use_back_order: bool = False
+        images: Optional[CardImages] = None
     ):
         """Draw a cut-ready page with cards, bleed, and guidelines.
         
         The rendering order:
         1. Draw cut guidelines (on white background)
-        2. Fill bleed area for each filled card position with black
+        2. Fill bleed area and card border for each filled position with black
         3. Draw card images
-        4. Draw card borders
         
         This ensures guidelines are behind the black bleed, so they won't
         be visible if cutting is slightly inaccurate.
@@ -569,80 +847,82 @@ class CutReadyPDFGenerator:
             group: List of card names (or None for empty slots)
             image_dir: Directory containing card images
             side: "front" or "back"
+            slots: (card index in group, (x, y)) per position; back pages
+                use the mirrored slots
             missing_files: List to append missing file paths
-            use_back_order: Whether to use mirrored order for back pages
+            images: Optional in-memory card images
         """
-        order = self.back_order if use_back_order else list(range(len(group)))
+        # Resolve the slot of each filled card once for all drawing steps
+        filled = _filled_slots(group, slots)
+        image_dir_str = os.fspath(image_dir)
+        filled_positions = [pos for _, pos in filled]
         
         # Step 1: Draw cut guidelines FIRST (on white background)
         # This way they'll be hidden under the black bleed if cut is accurate
-        self._draw_cut_guidelines(c, group, order)
+        self._draw_cut_guidelines(c, filled_positions)
         
-        # Step 2: Fill bleed background only for filled positions
+        # Step 2: Fill bleed background (with border) only for filled positions
         # This covers the guidelines in the bleed area
-        self._draw_bleed_background(c, group, order)
+        self._draw_bleed_background(c, filled_positions)
         
         # Step 3: Draw card images
-        for i, idx in enumerate(order):
-            card_name = group[idx]
-            if card_name is None:
-                continue
-            
+        for card_name, pos in filled:
             # Sanitize filename to match batch processor output
-            safe_name = self._sanitize_filename(card_name)
-            image_path = image_dir / f"{safe_name}_{side}.png"
+            safe_name = sanitize_filename(card_name)
+            image_path = os.path.join(image_dir_str, f"{safe_name}_{side}.png")
             
-            if not image_path.exists():
-                missing_files.append(str(image_path))
+            source = _card_image_source(card_name, side, image_path, images)
+            if source is None:
+                missing_files.append(image_path)
                 continue
             
-            pos = self.positions[i]
             c.drawImage(
-                str(image_path),
+                source,
                 pos[0], pos[1],
                 width=self.card_width,
                 height=self.card_height
             )
-        
-        # Step 4: Draw borders around each card
-        self._draw_card_borders(c, group, order)
     
     def _draw_bleed_background(
         self,
         c: canvas.Canvas,
-        group: List[Optional[str]],
-        order: List[int]
+        positions: List[Tuple[float, float]]
     ):
         """Draw black background only for filled card positions.
         
         This creates bleed borders around each card that has content,
-        leaving empty slots white.
+        leaving empty slots white. The card border (a black stroke of bleed
+        width centred on the bleed edge) is part of the same rectangle, so
+        the black area reaches 1.5 × bleed past the card.
         
         Args:
             c: ReportLab canvas
-            group: List of card names (or None for empty slots)
-            order: Order to draw cards (for back page mirroring)
+            positions: (x, y) positions of the filled cards
         """
-        c.setFillColorRGB(0, 0, 0)
+        if not positions:
+            return
+        
+        # Black rectangle with bleed and border for each filled position,
+        # as one path. Neighbouring rectangles overlap across narrow gaps,
+        # so the path is filled non-zero (the default even-odd rule would
+        # leave the overlaps unfilled)
+        outset = 1.5 * self.bleed
+        path = c.beginPath()
+        for x, y in positions:
+            path.rect(
+                x - outset,
+                y - outset,
+                self.card_width + 2 * outset,
+                self.card_height + 2 * outset
+            )
         
-        # Draw black rectangle with bleed for each filled position
-        for i, idx in enumerate(order):
-            if group[idx] is not None:
-                pos = self.positions[i]
-                c.rect(
-                    pos[0] - self.bleed,
-                    pos[1] - self.bleed,
-                    self.card_width + 2 * self.bleed,
-                    self.card_height + 2 * self.bleed,
-                    fill=1,
-                    stroke=0
-                )
+        c.setFillColorRGB(0, 0, 0)
+        c.drawPath(path, stroke=0, fill=1, fillMode=FILL_NON_ZERO)
     
     def _draw_cut_guidelines(
         self,
         c: canvas.Canvas,
-        group: List[Optional[str]],
-        order: List[int]
+        positions: List[Tuple[float, float]]
     ):
         """Draw dashed cut guidelines only at boundaries of filled cards.
         
@@ -651,83 +931,43 @@ class CutReadyPDFGenerator:
         
         Args:
             c: ReportLab canvas
-            group: List of card names (or None for empty slots)
-            order: Order to draw cards (for back page mirroring)
+            positions: (x, y) positions of the filled cards
         """
-        # Collect edges only for filled positions
+        # Collect edges only for filled positions (rounded so that shared
+        # edges computed by different float sums collapse into one line)
         verticals = set()
         horizontals = set()
         
-        for i, idx in enumerate(order):
-            if group[idx] is not None:
-                x, y = self.positions[i]
-                verticals.add(x)
-                verticals.add(x + self.card_width)
-                horizontals.add(y)
-                horizontals.add(y + self.card_height)
+        for x, y in positions:
+            verticals.add(round(x, 3))
+            verticals.add(round(x + self.card_width, 3))
+            horizontals.add(round(y, 3))
+            horizontals.add(round(y + self.card_height, 3))
         
-        # Draw dashed lines
-        c.setDash(3, 3)
-        c.setStrokeColorRGB(0.5, 0.5, 0.5)  # Gray
-        c.setLineWidth(0.5)
+        if not verticals:
+            return
+        
+        # Build all guidelines as one path
+        path = c.beginPath()
         
         # Vertical guidelines
-        for x in verticals:
-            c.line(x, 0, x, self.page_height)
+        for x in sorted(verticals):
+            path.moveTo(x, 0)
+            path.lineTo(x, self.page_height)
         
         # Horizontal guidelines
-        for y in horizontals:
-            c.line(0, y, self.page_width, y)
-        
-        c.setDash([])  # Reset to solid lines
-    
-    def _draw_card_borders(
-        self,
-        c: canvas.Canvas,
-        group: List[Optional[str]],
-        order: List[int]
-    ):
-        """Draw borders around each card for visual separation.
+        for y in sorted(horizontals):
+            path.moveTo(0, y)
+            path.lineTo(self.page_width, y)
         
-        Args:
-            c: ReportLab canvas
-            group: List of card names
-            order: Order to draw cards (for back page mirroring)
-        """
-        c.setLineWidth(self.bleed)
-        c.setStrokeColorRGB(0, 0, 0)
-        
-        for i, idx in enumerate(order):
-            if group[idx] is not None:
-                pos = self.positions[i]
-                c.rect(
-                    pos[0] - self.bleed,
-                    pos[1] - self.bleed,
-                    self.card_width + 2 * self.bleed,
-                    self.card_height + 2 * self.bleed,
-                    stroke=1,
-                    fill=0
-                )
-    
-    @staticmethod
-    def _sanitize_filename(name: str) -> str:
-        """Convert spell name to safe filename (matches batch processor logic).
-        
-        Args:
-            name: Spell name
-            
-        Returns:
-            Safe filename string
-        """
-        # Replace spaces with underscores
-        safe = name.replace(" ", "_")
-        
-        # Remove or replace unsafe characters
-        unsafe_chars = '<>:"/\\|?*\''
-        for char in unsafe_chars:
-            safe = safe.replace(char, "")
-        
-        # Convert to lowercase
-        safe = safe.lower()
-        
-        return safe
+        # Draw dashed lines; the dash and gray stroke only apply here
+        c.saveState()
+        c.setDash(3, 3)
+        c.setStrokeColorRGB(0.5, 0.5, 0.5)  # Gray
+        c.setLineWidth(0.5)
+        c.drawPath(path, stroke=1, fill=0)
+        c.restoreState()
+
+
+# Any of the layout generators above
+PDFLayoutGenerator = Union[PDFGenerator, SingleCardPDFGenerator, CutReadyPDFGenerator]
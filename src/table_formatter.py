@@ -1,9 +1,50 @@
 """Table detection and formatting for spell descriptions."""
 
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional
 
 
+# Table indicators (three of either kind make a table):
+# - numeric ranges like 01-00, 01-05
+# - multiple capitalized words (headers)
+_RANGE_INDICATOR_PATTERN = re.compile(r'\d{2}-\d{2}')
+_HEADER_INDICATOR_PATTERN = re.compile(r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+')
+
+
+# Table start patterns, tried in order.
+# Common: "TableName" followed by column headers
+_TABLE_START_PATTERNS = (
+    re.compile(r'([A-Z][a-z]+ ?[A-Z][a-z]+)\s*([A-Z][a-z]+[A-Z][a-z]+[A-Z][a-z]+)'),  # "Teleportation OutcomeFamiliarityMishap..."
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)\n([A-Z][a-z]+)'),  # "Table Name\nHeader"
+)
+
+# Table end patterns (usually before next sentence or section), tried in order:
+# period followed by capital letter, or "Familiarity." section
+_TABLE_END_PATTERNS = (
+    re.compile(r'\.\s+[A-Z][a-z]+\.'),  # ". Familiarity."
+    re.compile(r'\s+[A-Z][a-z]+\.\s+'),  # " Mishap. "
+)
+
+# Teleportation table cell: a dash (N/A) or a dice range (XX-XX)
+_TABLE_CELL_PATTERN = re.compile(r'—|\d{2}-\d{2}')
+
+# Simple table formatting
+_ENTRY_START_PATTERN = re.compile(r'([a-z])([A-Z][a-z]+:)')
+_RANGE_PATTERN = re.compile(r'(\d{2}-\d{2})')
+_MULTI_SPACE_PATTERN = re.compile(r'  +')
+
+
+def _has_three_matches(pattern: re.Pattern, text: str) -> bool:
+    """Return True if pattern matches text at least three times."""
+    count = 0
+    for _ in pattern.finditer(text):
+        count += 1
+        if count >= 3:
+            return True
+    return False
+
+
 class TableFormatter:
     """Detects and formats tables in spell descriptions."""
     
@@ -23,17 +64,12 @@ class TableFormatter:
         Returns:
             True if table detected
         """
-        # Look for table indicators
-        table_indicators = [
-            r'\d{2}-\d{2}',  # Numeric ranges like 01-00, 01-05
-            r'[A-Z][a-z]+\s+[A-Z][a-z]+\s+[A-Z][a-z]+',  # Multiple capitalized words (headers)
-        ]
-        
-        for pattern in table_indicators:
-            if len(re.findall(pattern, text)) >= 3:
-                return True
+        # A numeric range needs a hyphen; checking for one first skips the
+        # range scan for most descriptions
+        if '-' in text and _has_three_matches(_RANGE_INDICATOR_PATTERN, text):
+            return True
         
-        return False
+        return _has_three_matches(_HEADER_INDICATOR_PATTERN, text)
     
     @staticmethod
     def extract_table_section(text: str) -> Tuple[str, Optional[str], str]:
@@ -46,30 +82,17 @@ class TableFormatter:
         Returns:
             Tuple of (before_table, table_text, after_table)
         """
-        # Look for table start patterns
-        # Common: "TableName" followed by column headers
-        table_start_patterns = [
-            r'([A-Z][a-z]+ ?[A-Z][a-z]+)\s*([A-Z][a-z]+[A-Z][a-z]+[A-Z][a-z]+)',  # "Teleportation OutcomeFamiliarityMishap..."
-            r'([A-Z][a-z]+ [A-Z][a-z]+)\n([A-Z][a-z]+)',  # "Table Name\nHeader"
-        ]
-        
-        for pattern in table_start_patterns:
-            match = re.search(pattern, text)
+        for pattern in _TABLE_START_PATTERNS:
+            match = pattern.search(text)
             if match:
                 start_pos = match.start()
                 
-                # Find table end (usually before next sentence or section)
-                # Look for end patterns: period followed by capital letter, or "Familiarity." section
-                end_patterns = [
-                    r'\.\s+[A-Z][a-z]+\.',  # ". Familiarity."
-                    r'\s+[A-Z][a-z]+\.\s+',  # " Mishap. "
-                ]
-                
+                # Find table end
                 end_pos = len(text)
-                for end_pattern in end_patterns:
-                    end_match = re.search(end_pattern, text[start_pos:])
+                for end_pattern in _TABLE_END_PATTERNS:
+                    end_match = end_pattern.search(text, start_pos)
                     if end_match:
-                        end_pos = start_pos + end_match.start()
+                        end_pos = end_match.start()
                         break
                 
                 before = text[:start_pos]
@@ -121,32 +144,12 @@ class TableFormatter:
                 # Get next 20 characters (enough for 4 columns)
                 data = table_text[start:start+20]
                 
-                # Parse the 4 columns
-                columns = []
-                i = 0
-                
-                for col_num in range(4):
-                    if i >= len(data):
-                        columns.append("—")
-                        continue
-                    
-                    # Check for dash (N/A)
-                    if data[i] == '—':
-                        columns.append("—")
-                        i += 1
-                    # Check for dice range (XX-XX format)
-                    elif i + 4 < len(data) and data[i:i+2].isdigit() and data[i+2] == '-' and data[i+3:i+5].isdigit():
-                        columns.append(data[i:i+5])
-                        i += 5
-                    else:
-                        # Skip unknown character
-                        i += 1
-                        col_num -= 1  # Retry this column
+                # Parse the 4 columns: each is a dash (N/A) or a dice range;
+                # anything else between them is skipped
+                columns = _TABLE_CELL_PATTERN.findall(data)[:4]
                 
                 # Ensure we have exactly 4 columns
-                while len(columns) < 4:
-                    columns.append("—")
-                columns = columns[:4]
+                columns += ["—"] * (4 - len(columns))
                 
                 rows.append([fam_type] + columns)
         
@@ -179,9 +182,10 @@ class TableFormatter:
         col_widths = [0] * num_cols
         
         for row in rows:
-            for i, cell in enumerate(row):
-                if i < num_cols:
-                    col_widths[i] = max(col_widths[i], len(str(cell)))
+            for i, cell in enumerate(row[:num_cols]):
+                cell_len = len(str(cell))
+                if cell_len > col_widths[i]:
+                    col_widths[i] = cell_len
         
         # Check if we need to adjust widths
         spacing = 3  # spaces between columns
@@ -192,12 +196,9 @@ class TableFormatter:
             # Priority: keep data columns (dice ranges) full width, scale down text columns
             available_width = max_width - (num_cols - 1) * spacing
             
-            # Identify which columns have mostly short content (dice ranges)
-            short_cols = []
-            for i in range(num_cols):
-                max_len = max(len(str(row[i])) for row in rows)
-                if max_len <= 10:  # Short columns (like "01-00")
-                    short_cols.append(i)
+            # Identify which columns have mostly short content (dice ranges).
+            # col_widths already holds each column's longest cell here.
+            short_cols = {i for i in range(num_cols) if col_widths[i] <= 10}  # e.g. "01-00"
             
             # Calculate space needed for short columns
             short_space = sum(col_widths[i] for i in short_cols)
@@ -219,15 +220,12 @@ class TableFormatter:
         # Format rows
         formatted_lines = []
         for i, row in enumerate(rows):
-            line_parts = []
-            for j, cell in enumerate(row):
-                if j < num_cols:
-                    cell_str = str(cell)
-                    # Truncate if needed
-                    if len(cell_str) > col_widths[j]:
-                        cell_str = cell_str[:col_widths[j]-1] + "…"
-                    line_parts.append(cell_str.ljust(col_widths[j]))
-            
+            # Pad cells to the column width, or truncate the ones that
+            # don't fit (zip stops at num_cols)
+            line_parts = [
+                cell.ljust(width) if len(cell) <= width else cell[:width-1] + "…"
+                for cell, width in zip(map(str, row), col_widths)
+            ]
             formatted_lines.append("   ".join(line_parts))
             
             # Add separator after header
@@ -250,21 +248,25 @@ class TableFormatter:
             Formatted text
         """
         # Add line breaks before capital letters that start new entries
-        text = re.sub(r'([a-z])([A-Z][a-z]+:)', r'\1\n  \2', text)
+        text = _ENTRY_START_PATTERN.sub(r'\1\n  \2', text)
         
         # Add spacing around numeric ranges
-        text = re.sub(r'(\d{2}-\d{2})', r' \1 ', text)
+        text = _RANGE_PATTERN.sub(r' \1 ', text)
         
         # Clean up multiple spaces
-        text = re.sub(r'  +', '  ', text)
+        text = _MULTI_SPACE_PATTERN.sub('  ', text)
         
         return text
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def format_description_with_table(description: str, max_width: int = 80) -> str:
         """
         Format description, detecting and formatting any tables.
         
+        Results are cached per description, so cards drawn again (for
+        another layout or PDF mode) skip the table detection.
+        
         Args:
             description: Full spell description
             max_width: Maximum character width for table (default 80)
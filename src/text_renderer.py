@@ -9,13 +9,13 @@ Key Features:
 - Dynamic font sizing: Automatically finds largest font that fits
 - Paragraph preservation: Maintains original paragraph structure
 - Optimal space usage: Maximizes readability while fitting constraints
-- Efficient algorithm: Binary search for O(log n) performance
+- Efficient algorithm: Size predicted from measured height, then verified
 
 Main Classes:
 - TextRenderer: Core rendering engine with all text operations
 
 Algorithm Overview:
-1. Find optimal font size (binary search)
+1. Find optimal font size (predicted, then verified)
 2. Wrap text to fit width (preserving paragraphs)
 3. Calculate layout (line positions with spacing)
 4. Render text on image (using PIL)
@@ -43,15 +43,30 @@ For detailed algorithm documentation, see TEXT_RENDERING_ALGORITHM.md
 Author: D&D Spell Card Generator V2
 """
 
+import math
 import textwrap
 from typing import Tuple, List, Optional
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 
+# Scratch drawing context for text measurement (textbbox only reads the
+# font, so one shared 1x1 image serves every renderer and thread)
+_MEASURE_DRAW = ImageDraw.Draw(Image.new('RGB', (1, 1)))
+
+
 class TextRenderer:
     """Handles text measurement, fitting, and rendering on images."""
     
+    # Measured (text, size) pairs kept before the cache is reset
+    MEASURE_CACHE_SIZE = 4096
+    # Wrapped (text, wrap width) pairs kept before the cache is reset
+    WRAP_CACHE_SIZE = 256
+    # Rasterized (line, size) masks kept before the cache is reset
+    LINE_CACHE_SIZE = 512
+    # Font size search results kept before the cache is reset
+    SIZE_CACHE_SIZE = 1024
+    
     def __init__(self, font_path: Path):
         """
         Initialize text renderer with a font.
@@ -61,6 +76,11 @@ class TextRenderer:
         """
         self.font_path = font_path
         self._font_cache = {}
+        self._measure_cache = {}
+        self._glyph_extents = {}
+        self._wrap_cache = {}
+        self._line_cache = {}
+        self._size_cache = {}
     
     def get_font(self, size: int) -> ImageFont.FreeTypeFont:
         """
@@ -72,13 +92,18 @@ class TextRenderer:
         Returns:
             Font object at requested size
         """
-        if size not in self._font_cache:
-            self._font_cache[size] = ImageFont.truetype(str(self.font_path), size)
-        return self._font_cache[size]
+        font = self._font_cache.get(size)
+        if font is None:
+            font = ImageFont.truetype(str(self.font_path), size)
+            self._font_cache[size] = font
+        return font
     
     def measure_text(self, text: str, font_size: int) -> Tuple[int, int]:
         """
-        Measure the dimensions of text at given font size.
+        Measure the dimensions of text at given font size (cached).
+        
+        The font size search and the final layout measure the same lines
+        many times, and each measurement runs the full text shaping.
         
         Args:
             text: Text to measure
@@ -87,18 +112,107 @@ class TextRenderer:
         Returns:
             Tuple of (width, height) in pixels
         """
-        font = self.get_font(font_size)
+        left, top, right, bottom = self._text_bbox(text, font_size)
+        return right - left, bottom - top
+    
+    def _text_bbox(self, text: str, font_size: int) -> Tuple[int, int, int, int]:
+        """Bounding box of text drawn at (0, 0), cached per (text, size)."""
+        key = (text, font_size)
+        bbox = self._measure_cache.get(key)
+        if bbox is not None:
+            return bbox
         
-        # Create temporary image for measurement
-        temp_img = Image.new('RGB', (1, 1))
-        draw = ImageDraw.Draw(temp_img)
+        font = self.get_font(font_size)
         
         # Use textbbox for accurate measurement
-        bbox = draw.textbbox((0, 0), text, font=font)
-        width = bbox[2] - bbox[0]
-        height = bbox[3] - bbox[1]
+        bbox = _MEASURE_DRAW.textbbox((0, 0), text, font=font)
+        
+        if len(self._measure_cache) >= self.MEASURE_CACHE_SIZE:
+            self._measure_cache.clear()
+        self._measure_cache[key] = bbox
+        return bbox
+    
+    def measure_height(self, text: str, font_size: int) -> int:
+        """
+        Measure the bounding box height of a single line of text.
+        
+        Gives the same result as measure_text, without shaping the line:
+        with the basic layout, glyphs are only placed side by side, so the
+        line's vertical extent is the union of its glyphs' extents, which
+        are measured once per character and size.
+        
+        Args:
+            text: Text to measure (a single line)
+            font_size: Font size in points
+            
+        Returns:
+            Height in pixels
+        """
+        font = self.get_font(font_size)
+        if font.layout_engine != ImageFont.Layout.BASIC or "\n" in text:
+            # Complex layout can substitute or shift glyphs
+            return self.measure_text(text, font_size)[1]
+        if not text:
+            return 0
+        
+        extents = self._glyph_extents.get(font_size)
+        if extents is None:
+            extents = self._glyph_extents[font_size] = {}
+        
+        top = bottom = None
+        for char in set(text):
+            extent = extents.get(char)
+            if extent is None:
+                _, char_top, _, char_bottom = font.getbbox(char)
+                extent = extents[char] = (char_top, char_bottom)
+            if top is None or extent[0] < top:
+                top = extent[0]
+            if bottom is None or extent[1] > bottom:
+                bottom = extent[1]
+        
+        return bottom - top
+    
+    def draw_line(
+        self,
+        image: Image.Image,
+        xy: Tuple[int, int],
+        line: str,
+        font_size: int,
+        color: str = "black"
+    ) -> None:
+        """
+        Draw a single line of text (rasterized once per line and size).
+        
+        Stock phrases like "1 action" or "Instantaneous" appear on many
+        cards. The glyph coverage of each line is kept as an "L" mask and
+        pasted with the requested color, which gives the same pixels as
+        drawing the text directly.
         
-        return width, height
+        Args:
+            image: Image to draw on
+            xy: (x, y) position, as for ImageDraw.text
+            line: Text of the line (no newlines)
+            font_size: Font size in points
+            color: Text color
+        """
+        key = (line, font_size)
+        cached = self._line_cache.get(key)
+        if cached is None:
+            left, top, right, bottom = self._text_bbox(line, font_size)
+            mask = None
+            if right > left and bottom > top:
+                mask = Image.new('L', (right - left, bottom - top))
+                ImageDraw.Draw(mask).text(
+                    (-left, -top), line, font=self.get_font(font_size), fill=255
+                )
+            cached = (mask, left, top)
+            if len(self._line_cache) >= self.LINE_CACHE_SIZE:
+                self._line_cache.clear()
+            self._line_cache[key] = cached
+        
+        mask, left, top = cached
+        if mask is not None:
+            image.paste(color, (xy[0] + left, xy[1] + top), mask)
     
     def calculate_wrap_width(self, font_size: int, max_width: int) -> int:
         """
@@ -179,6 +293,13 @@ class TextRenderer:
         Returns:
             List of lines (None represents paragraph breaks)
         """
+        # The size search and the final layout wrap the same text at the
+        # same width, so results are cached (as tuples; callers get a list)
+        key = (text, wrap_width)
+        cached = self._wrap_cache.get(key)
+        if cached is not None:
+            return list(cached)
+        
         paragraphs = text.splitlines()
         lines = []
         
@@ -190,6 +311,9 @@ class TextRenderer:
                 # Empty line represents paragraph break
                 lines.append(None)
         
+        if len(self._wrap_cache) >= self.WRAP_CACHE_SIZE:
+            self._wrap_cache.clear()
+        self._wrap_cache[key] = tuple(lines)
         return lines
     
     def calculate_text_height(
@@ -206,18 +330,18 @@ class TextRenderer:
         appropriate spacing between lines and paragraphs.
         
         Algorithm:
-        1. Get font metrics (ascent + descent = line height)
-        2. Initialize total_height = 0
-        3. For each line:
+        1. Initialize total_height = 0
+        2. For each line:
            a. If None (paragraph break):
               - Add paragraph_spacing to total
            b. If text line:
+              - Measure line_height (bounding box height, see measure_height)
               - Add line_height + line_spacing to total
-        4. Subtract final line_spacing (no space after last line)
-        5. Return total_height
+        3. Subtract final line_spacing (no space after last line)
+        4. Return total_height
         
         Spacing Types:
-        - Font height: Built into font (ascent + descent)
+        - Line height: Bounding box of the line's glyphs
         - line_spacing: Extra pixels between consecutive lines
         - paragraph_spacing: Extra pixels between paragraphs
         
@@ -246,7 +370,7 @@ class TextRenderer:
             if line is None:
                 total_height += paragraph_spacing
             else:
-                _, line_height = self.measure_text(line, font_size)
+                line_height = self.measure_height(line, font_size)
                 total_height += line_height + line_spacing
         
         # Remove trailing line spacing
@@ -255,6 +379,51 @@ class TextRenderer:
         
         return total_height
     
+    def _fits(
+        self,
+        text: str,
+        font_size: int,
+        max_width: int,
+        max_height: int,
+        line_spacing: int,
+        paragraph_spacing: int
+    ) -> Tuple[bool, int]:
+        """
+        Check whether text fits within bounds at a font size.
+        
+        Args:
+            text: Text to fit
+            font_size: Font size to test
+            max_width: Maximum width in pixels
+            max_height: Maximum height in pixels
+            line_spacing: Extra pixels between consecutive lines
+            paragraph_spacing: Extra pixels between paragraphs
+            
+        Returns:
+            Tuple of (fits, total height of the wrapped text in pixels)
+        """
+        # Calculate how many characters fit per line at this font size
+        # and wrap text to that width (preserving paragraphs)
+        wrap_width = self.calculate_wrap_width(font_size, max_width)
+        lines = self.wrap_text(text, wrap_width)
+        
+        # Calculate total height needed for all lines (cheap: line heights
+        # come from per-glyph extents)
+        total_height = self.calculate_text_height(
+            lines, font_size, line_spacing, paragraph_spacing
+        )
+        if total_height > max_height:
+            return False, total_height
+        
+        # Check if all lines fit within max_width
+        # (wrap_width is conservative, but we verify actual pixel width)
+        lines_fit_width = all(
+            line is None or self.measure_text(line, font_size)[0] <= max_width
+            for line in lines
+        )
+        
+        return lines_fit_width, total_height
+    
     def find_optimal_font_size(
         self,
         text: str,
@@ -266,29 +435,27 @@ class TextRenderer:
         paragraph_spacing: int = 10
     ) -> int:
         """
-        Find largest font size that fits text within bounds using binary search.
+        Find largest font size that fits text within bounds.
         
-        This is the core algorithm for dynamic text sizing. It uses binary search
-        to efficiently find the largest font size that allows all text to fit
-        within the specified width and height constraints.
+        This is the core algorithm for dynamic text sizing. Text height grows
+        roughly with the square of the font size (taller lines, and fewer
+        characters per line), so the height measured at the maximum size
+        predicts the fitting size closely. Starting from that prediction
+        usually takes two or three checks instead of a full binary search.
         
         Algorithm:
-        1. Start with range [min_size, max_size]
-        2. Test middle value (mid):
-           - Wrap text at this font size
-           - Calculate total height needed
-           - Check if it fits within max_width and max_height
-        3. If text fits:
-           - Save mid as best candidate
-           - Try larger fonts (search upper half: [mid+1, max_size])
-        4. If text doesn't fit:
-           - Try smaller fonts (search lower half: [min_size, mid-1])
-        5. Repeat until range is exhausted
-        6. Return best (largest size that fits)
-        
-        Time Complexity: O(log n × m) where:
-        - n = (max_size - min_size) = font size range
-        - m = text length (for wrapping and measuring)
+        1. Test max_size; if the text fits, return it (short text)
+        2. Predict the size from the height needed at max_size:
+           guess = max_size × √(max_height / height)
+        3. If the text fits at guess:
+           - Step up one size at a time while the next size still fits
+        4. If it doesn't fit:
+           - Step down one size at a time, up to three sizes
+           - Binary search the sizes below that ([min_size, guess-4])
+        5. Return the largest size found to fit (or min_size if none does)
+        
+        The result only depends on the arguments, so it is cached: stat
+        boxes with the same value on many cards are sized once.
         
         Example:
         >>> renderer.find_optimal_font_size(
@@ -317,41 +484,70 @@ class TextRenderer:
         Returns:
             Optimal font size in points (or min_size if text doesn't fit at minimum)
         """
-        # Binary search for optimal font size
-        # We want the LARGEST size that fits, so we search from high to low
+        key = (text, min_size, max_size, max_width, max_height,
+               line_spacing, paragraph_spacing)
+        size = self._size_cache.get(key)
+        if size is None:
+            size = self._search_font_size(*key)
+            if len(self._size_cache) >= self.SIZE_CACHE_SIZE:
+                self._size_cache.clear()
+            self._size_cache[key] = size
+        return size
+    
+    def _search_font_size(
+        self,
+        text: str,
+        min_size: int,
+        max_size: int,
+        max_width: int,
+        max_height: int,
+        line_spacing: int,
+        paragraph_spacing: int
+    ) -> int:
+        """Uncached font size search (see find_optimal_font_size)."""
+        if max_size <= min_size:
+            return min_size
+        
+        def fits(size: int) -> Tuple[bool, int]:
+            return self._fits(
+                text, size, max_width, max_height, line_spacing, paragraph_spacing
+            )
+        
+        # Step 1: Short text fits at the maximum size
+        fits_max, height = fits(max_size)
+        if fits_max:
+            return max_size
+        
+        # Step 2: Predict the size from the height needed at max_size (a box
+        # with no room left, max_height <= 0, predicts min_size)
+        guess = max_size - 1
+        if height > 0:
+            ratio = max(max_height, 0) / height
+            guess = min(guess, int(max_size * math.sqrt(ratio)))
+        guess = max(min_size, guess)
+        
+        # Step 3: The guess fits, so try larger sizes one at a time
+        if fits(guess)[0]:
+            while guess + 1 < max_size and fits(guess + 1)[0]:
+                guess += 1
+            return guess
+        
+        # Step 4: Try a few smaller sizes one at a time (the prediction is
+        # usually within a couple of sizes), then binary search the rest
+        for size in range(guess - 1, max(min_size, guess - 3) - 1, -1):
+            if fits(size)[0]:
+                return size
+        
         low = min_size
-        high = max_size
+        high = guess - 4
         best = low  # Start with minimum as fallback
         
         while low <= high:
-            mid = (low + high) // 2  # Test middle of range
-            
-            # Step 1: Calculate how many characters fit per line at this font size
-            wrap_width = self.calculate_wrap_width(mid, max_width)
-            
-            # Step 2: Wrap text to that width (preserving paragraphs)
-            lines = self.wrap_text(text, wrap_width)
-            
-            # Step 3: Check if all lines fit within max_width
-            # (wrap_width is conservative, but we verify actual pixel width)
-            lines_fit_width = all(
-                line is None or self.measure_text(line, mid)[0] <= max_width
-                for line in lines
-            )
-            
-            # Step 4: Calculate total height needed for all lines
-            total_height = self.calculate_text_height(
-                lines, mid, line_spacing, paragraph_spacing
-            )
-            fits_height = total_height <= max_height
-            
-            # Step 5: Decide which direction to search
-            if lines_fit_width and fits_height:
-                # Text fits! Save this size and try larger
+            mid = (low + high) // 2
+            if fits(mid)[0]:
                 best = mid
                 low = mid + 1  # Search upper half [mid+1, high]
             else:
-                # Text doesn't fit, try smaller
                 high = mid - 1  # Search lower half [low, mid-1]
         
         return best
@@ -382,27 +578,24 @@ class TextRenderer:
             color: Text color
             wrap_width: Optional fixed wrap width (otherwise calculated)
         """
-        draw = ImageDraw.Draw(image)
-        
         # Find optimal font size
         if wrap_width is None:
             font_size = self.find_optimal_font_size(
                 text, min_font_size, max_font_size, max_width, max_height
             )
             wrap_width = self.calculate_wrap_width(font_size, max_width)
+            lines = self.wrap_text(text, wrap_width)
         else:
+            # The wrap width is fixed, so only the height changes with size
+            lines = self.wrap_text(text, wrap_width)
             font_size = max_font_size
             # Reduce font size until it fits
             while font_size >= min_font_size:
-                lines = self.wrap_text(text, wrap_width)
                 height = self.calculate_text_height(lines, font_size)
                 if height <= max_height:
                     break
                 font_size -= 1
         
-        font = self.get_font(font_size)
-        lines = self.wrap_text(text, wrap_width)
-        
         # Calculate total height
         total_height = self.calculate_text_height(lines, font_size)
         
@@ -416,7 +609,7 @@ class TextRenderer:
             else:
                 line_width, line_height = self.measure_text(line, font_size)
                 x = center[0] - line_width // 2
-                draw.text((x, current_y), line, font=font, fill=color)
+                self.draw_line(image, (x, current_y), line, font_size, color)
                 current_y += line_height + 2  # Line spacing
     
     def render_text_left_aligned(
@@ -447,15 +640,12 @@ class TextRenderer:
             line_spacing: Extra pixels between lines
             paragraph_spacing: Extra pixels between paragraphs
         """
-        draw = ImageDraw.Draw(image)
-        
         # Find optimal font size
         font_size = self.find_optimal_font_size(
             text, min_font_size, max_font_size, max_width, max_height,
             line_spacing, paragraph_spacing
         )
         
-        font = self.get_font(font_size)
         wrap_width = self.calculate_wrap_width(font_size, max_width)
         lines = self.wrap_text(text, wrap_width)
         
@@ -465,6 +655,6 @@ class TextRenderer:
             if line is None:
                 current_y += paragraph_spacing
             else:
-                _, line_height = self.measure_text(line, font_size)
-                draw.text((top_left[0], current_y), line, font=font, fill=color)
+                line_height = self.measure_height(line, font_size)
+                self.draw_line(image, (top_left[0], current_y), line, font_size, color)
                 current_y += line_height + line_spacing
@@ -0,0 +1,31 @@
+"""Shared pytest fixtures."""
+
+import os
+import shutil
+
+import pytest
+from PIL import Image
+
+
+@pytest.fixture(scope="session")
+def blank_card_png(tmp_path_factory):
+    """Placeholder card image, encoded once per test session."""
+    path = tmp_path_factory.mktemp("blank") / "card_blank.png"
+    Image.new("RGB", (210, 298), color="white").save(path, compress_level=0)
+    return path
+
+
+@pytest.fixture
+def card_images(blank_card_png):
+    """Place copies of the placeholder card image in a directory.
+
+    Returns a function taking the directory and the filenames to create.
+    """
+    def place(image_dir, *filenames):
+        for filename in filenames:
+            try:
+                os.link(blank_card_png, image_dir / filename)
+            except OSError:
+                shutil.copyfile(blank_card_png, image_dir / filename)
+
+    return place
@@ -10,6 +10,23 @@ from src.models import SpellData, AssetCollection
 from src.card_generator import CardGenerator
 
 
+class DummyCardGenerator:
+    """Picklable stand-in for CardGenerator, for worker-process tests."""
+    
+    def generate_card_front(self, spell, path=None):
+        return self._make_card((255, 0, 0, 255), path)
+    
+    def generate_card_back(self, spell, path=None):
+        return self._make_card((0, 0, 255, 255), path)
+    
+    @staticmethod
+    def _make_card(color, path):
+        img = Image.new('RGBA', (100, 100), color)
+        if path is not None:
+            img.save(path, "PNG")
+        return img
+
+
 @pytest.fixture
 def mock_card_generator():
     """Create a mock card generator."""
@@ -151,6 +168,53 @@ def test_process_with_progress_callback(mock_card_generator, sample_spells, tmp_
     assert progress_calls[2] == (3, 3, "Shield")
 
 
+def test_process_spells_parallel(sample_spells, tmp_path):
+    """Test processing spells with multiple worker processes."""
+    progress_calls = []
+    
+    def progress_callback(current, total, spell_name):
+        progress_calls.append((current, total, spell_name))
+    
+    processor = BatchProcessor(
+        card_generator=DummyCardGenerator(),
+        output_dir=tmp_path,
+        progress_callback=progress_callback,
+        max_workers=2
+    )
+    
+    results = processor.process_spells(sample_spells)
+    
+    assert list(results) == ["Fireball", "Magic Missile", "Shield"]
+    assert all(r.success for r in results.values())
+    assert all(r.front_path.exists() and r.back_path.exists() for r in results.values())
+    
+    # Progress is reported in input order, as without a pool
+    assert progress_calls == [
+        (1, 3, "Fireball"), (2, 3, "Magic Missile"), (3, 3, "Shield")
+    ]
+
+
+def test_process_spells_in_memory(sample_spells, tmp_path):
+    """Test that in-memory processing keeps images and writes no files."""
+    processor = BatchProcessor(
+        card_generator=DummyCardGenerator(),
+        output_dir=tmp_path,
+        in_memory=True
+    )
+    
+    results = processor.process_spells(sample_spells)
+    
+    assert all(r.success for r in results.values())
+    assert all(r.front_path is None and r.back_path is None for r in results.values())
+    assert list(tmp_path.glob("*.png")) == []
+    
+    images = processor.get_card_images(results)
+    assert set(images) == {"Fireball", "Magic Missile", "Shield"}
+    front, back = images["Fireball"]
+    assert front.size == (100, 100)
+    assert back.getpixel((0, 0)) == (0, 0, 255, 255)
+
+
 def test_process_continues_on_error(mock_card_generator, sample_spells, tmp_path):
     """Test that processing continues when one spell fails."""
     # Make second spell fail
@@ -2,9 +2,27 @@
 
 import pytest
 from pathlib import Path
+from src.card_generator import CardGenerator
 from src.cli import SpellCardCLI
 
 
+@pytest.fixture(scope="session")
+def no_pdf_run(tmp_path_factory):
+    """Run the CLI once with --no-pdf on the test data.
+    
+    Returns the exit code and the output directory, which the tests only
+    inspect.
+    """
+    output_dir = tmp_path_factory.mktemp("no_pdf")
+    exit_code = SpellCardCLI().run([
+        '--csv', 'test_data/test_spells.csv',
+        '--output', str(output_dir),
+        '--no-pdf',
+        '--quiet'
+    ])
+    return exit_code, output_dir
+
+
 class TestCLI:
     """Tests for SpellCardCLI class."""
     
@@ -26,6 +44,28 @@ class TestCLI:
         assert args.grid == '2x4'  # Updated default
         assert args.orientation == 'landscape'  # Updated default
         assert args.no_pdf is False
+        assert args.workers >= 1
+        assert args.resize_quality == 'best'
+    
+    def test_parse_workers(self):
+        """Test --workers option."""
+        cli = SpellCardCLI()
+        args = cli.parse_args(['--csv', 'test.csv', '--workers', '4'])
+        assert args.workers == 4
+        
+        for value in ['0', '-2', 'many']:
+            with pytest.raises(SystemExit):
+                cli.parse_args(['--csv', 'test.csv', '--workers', value])
+    
+    def test_parse_resize_quality(self):
+        """Test --resize-quality option."""
+        cli = SpellCardCLI()
+        for quality in CardGenerator.RESIZE_QUALITIES:
+            args = cli.parse_args(['--csv', 'test.csv', '--resize-quality', quality])
+            assert args.resize_quality == quality
+        
+        with pytest.raises(SystemExit):
+            cli.parse_args(['--csv', 'test.csv', '--resize-quality', 'ultra'])
     
     def test_parse_all_args(self):
         """Test parsing all arguments."""
@@ -203,25 +243,18 @@ class TestCLIExecution:
         png_files = list(tmp_path.glob('*.png'))
         assert len(png_files) == 0  # Cleaned up by default
     
-    def test_run_no_pdf(self, tmp_path):
+    def test_run_no_pdf(self, no_pdf_run):
         """Test execution with --no-pdf flag."""
-        cli = SpellCardCLI()
-        
-        exit_code = cli.run([
-            '--csv', 'test_data/test_spells.csv',
-            '--output', str(tmp_path),
-            '--no-pdf',
-            '--quiet'
-        ])
+        exit_code, output_dir = no_pdf_run
         
         assert exit_code == 0
         
         # Check no PDF created
-        pdf_files = list(tmp_path.glob('*.pdf'))
+        pdf_files = list(output_dir.glob('*.pdf'))
         assert len(pdf_files) == 0
         
         # Check card images exist
-        png_files = list(tmp_path.glob('*.png'))
+        png_files = list(output_dir.glob('*.png'))
         assert len(png_files) == 6
     
     def test_run_custom_pdf_name(self, tmp_path):
@@ -308,23 +341,16 @@ class TestCLIExecution:
         png_files = list(tmp_path.glob('*.png'))
         assert len(png_files) == 6  # 3 spells × 2 sides
     
-    def test_run_no_pdf_keeps_images(self, tmp_path):
+    def test_run_no_pdf_keeps_images(self, no_pdf_run):
         """Test that --no-pdf preserves PNG files (no cleanup)."""
-        cli = SpellCardCLI()
-        
-        exit_code = cli.run([
-            '--csv', 'test_data/test_spells.csv',
-            '--output', str(tmp_path),
-            '--no-pdf',
-            '--quiet'
-        ])
+        exit_code, output_dir = no_pdf_run
         
         assert exit_code == 0
         
         # Check no PDF created
-        pdf_files = list(tmp_path.glob('*.pdf'))
+        pdf_files = list(output_dir.glob('*.pdf'))
         assert len(pdf_files) == 0
         
         # Check PNG files exist (not cleaned up)
-        png_files = list(tmp_path.glob('*.png'))
+        png_files = list(output_dir.glob('*.png'))
         assert len(png_files) == 6
@@ -3,28 +3,51 @@
 import pytest
 import csv
 from pathlib import Path
-from src.data_loader import load_spell_data, load_assets, find_illustration, DataLoadError
+from src.data_loader import (
+    load_spell_data, iter_spell_data, load_assets, find_illustration, DataLoadError
+)
 from src.models import SpellData
 
 
-def test_load_spell_data_valid(tmp_path):
-    """Test loading valid spell data from CSV."""
-    csv_file = tmp_path / "spells.csv"
+@pytest.fixture(scope="module")
+def valid_spells_csv(tmp_path_factory):
+    """Valid spell CSV, written once for the module."""
+    csv_file = tmp_path_factory.mktemp("data") / "spells.csv"
     csv_file.write_text(
         'Name,Level,Casting Time,Duration,Range,Components,Classes,Text,At Higher Levels\n'
         'Fireball,3rd,Action,Instantaneous,150 feet,"V, S, M (a tiny ball of bat guano)","Sorcerer, Wizard",A bright streak...,When you cast this spell...\n'
         'Light,Cantrip,Action,1 hour,Touch,"V, M (a firefly)","Bard, Cleric",You touch one object...,\n'
     )
+    return csv_file
+
+
+@pytest.fixture(scope="module")
+def valid_spells(valid_spells_csv):
+    """Spells parsed once from the valid CSV (read-only in tests)."""
+    return load_spell_data(valid_spells_csv)
+
+
+def test_load_spell_data_valid(valid_spells):
+    """Test loading valid spell data from CSV."""
+    assert len(valid_spells) == 2
+    assert valid_spells[0].name == "Fireball"
+    assert valid_spells[0].level == "3rd"
+    assert valid_spells[0].classes == ["Sorcerer", "Wizard"]
+    assert valid_spells[0].at_higher_levels == "When you cast this spell..."
+
+
+def test_load_spell_data_empty_optional_field(valid_spells):
+    """Test that an empty At Higher Levels field loads as None."""
+    assert valid_spells[1].name == "Light"
+    assert valid_spells[1].at_higher_levels is None
+
+
+def test_iter_spell_data(valid_spells_csv, valid_spells):
+    """Test that spells are yielded one at a time in file order."""
+    spells = iter_spell_data(valid_spells_csv)
     
-    spells = load_spell_data(csv_file)
-    
-    assert len(spells) == 2
-    assert spells[0].name == "Fireball"
-    assert spells[0].level == "3rd"
-    assert spells[0].classes == ["Sorcerer", "Wizard"]
-    assert spells[0].at_higher_levels == "When you cast this spell..."
-    assert spells[1].name == "Light"
-    assert spells[1].at_higher_levels is None
+    assert next(spells) == valid_spells[0]
+    assert [spell.name for spell in spells] == ["Light"]
 
 
 def test_load_spell_data_missing_file():
@@ -42,6 +65,24 @@ def test_load_spell_data_missing_columns(tmp_path):
         load_spell_data(csv_file)
 
 
+def test_load_spell_data_warns_once_per_unknown_class(tmp_path, capsys):
+    """Test that each unknown class is reported only at its first row."""
+    csv_file = tmp_path / "spells.csv"
+    csv_file.write_text(
+        'Name,Level,Casting Time,Duration,Range,Components,Classes,Text\n'
+        'Light,Cantrip,Action,1 hour,Touch,V,"Bard, Mystic",Text\n'
+        'Shield,1st,Reaction,1 round,Self,"V, S","Mystic, Wizard, Psion",Text\n'
+    )
+    
+    spells = load_spell_data(csv_file)
+    
+    assert spells[1].classes == ["Mystic", "Wizard", "Psion"]
+    assert capsys.readouterr().out.splitlines() == [
+        "Warning: Row 2 - Unknown classes: Mystic",
+        "Warning: Row 3 - Unknown classes: Psion",
+    ]
+
+
 def test_load_spell_data_empty_file(tmp_path):
     """Test error when CSV file is empty."""
     csv_file = tmp_path / "spells.csv"
@@ -119,6 +160,46 @@ def test_spell_data_level_numeric():
     assert third.level_numeric == "3"
 
 
+def test_spell_data_derived_fields_follow_updates():
+    """Test that derived values reflect fields changed after first use."""
+    spell = SpellData(
+        name="Fireball",
+        level="3rd",
+        casting_time="Action",
+        duration="Instantaneous",
+        range="150 feet",
+        components="V, S, M (a tiny ball of bat guano)",
+        classes=["Wizard"],
+        description="Test"
+    )
+    assert spell.level_numeric == "3"
+    assert spell.components_short == "V, S, M"
+    
+    spell.level = "Cantrip"
+    spell.components = "V, S"
+    assert spell.level_numeric == "0"
+    assert spell.components_short == "V, S"
+
+
+def test_spell_data_safe_name():
+    """Test sanitized filename base for card images."""
+    spell = SpellData(
+        name="Tasha's Hideous Laughter",
+        level="1st",
+        casting_time="Action",
+        duration="1 minute",
+        range="30 feet",
+        components="V, S, M",
+        classes=["Bard", "Wizard"],
+        description="Test"
+    )
+    assert spell.safe_name == "tashas_hideous_laughter"
+    
+    # Follows a renamed spell
+    spell.name = "Hideous Laughter"
+    assert spell.safe_name == "hideous_laughter"
+
+
 def test_find_illustration_found(tmp_path):
     """Test finding illustration file."""
     illus_dir = tmp_path / "illustrations"
@@ -141,6 +222,28 @@ def test_find_illustration_not_found(tmp_path):
     assert result is None
 
 
+def test_find_illustration_extension_priority(tmp_path):
+    """Test that .jpg wins over .png and filenames match case-insensitively."""
+    illus_dir = tmp_path / "illustrations"
+    illus_dir.mkdir()
+    (illus_dir / "magic_missile.png").write_text("fake image")
+    (illus_dir / "Magic_Missile.JPG").write_text("fake image")
+    
+    result = find_illustration("Magic Missile", illus_dir)
+    assert result == illus_dir / "Magic_Missile.JPG"
+
+
+def test_find_illustration_sees_new_files(tmp_path):
+    """Test that each lookup sees files added since the previous one."""
+    illus_dir = tmp_path / "illustrations"
+    illus_dir.mkdir()
+    
+    assert find_illustration("Fireball", illus_dir) is None
+    
+    (illus_dir / "fireball.png").write_text("fake image")
+    assert find_illustration("Fireball", illus_dir) == illus_dir / "fireball.png"
+
+
 def test_find_illustration_dir_not_exists(tmp_path):
     """Test when illustration directory doesn't exist."""
     result = find_illustration("Fireball", tmp_path / "nonexistent")
@@ -173,6 +276,21 @@ def test_load_assets_structure(tmp_path):
     assert "Wizard" in assets.class_banners
 
 
+def test_load_assets_picks_up_changes(tmp_path):
+    """Test that each call reflects the asset directory as it is now."""
+    asset_dir = tmp_path / "assets"
+    font_dir = asset_dir / "fonts"
+    font_dir.mkdir(parents=True)
+    
+    first = load_assets(asset_dir)
+    assert first.font_path == font_dir / "font.ttf"  # Fallback, no font yet
+    
+    (font_dir / "card.ttf").write_text("fake")
+    second = load_assets(asset_dir)
+    assert second.font_path == font_dir / "card.ttf"
+    assert second is not first
+
+
 def test_load_assets_missing_dir():
     """Test error when asset directory doesn't exist."""
     with pytest.raises(DataLoadError, match="Asset directory not found"):
@@ -3,11 +3,14 @@
 import pytest
 from pathlib import Path
 from PIL import Image
+from reportlab.pdfgen import canvas
 from src.pdf_generator import (
     PDFGenerator,
     GridConfig,
     SingleCardPDFGenerator,
-    CutReadyPDFGenerator
+    CutReadyPDFGenerator,
+    generate_pdfs,
+    _GridPDFGenerator
 )
 
 
@@ -45,17 +48,57 @@ class TestGridConfig:
         """Test validation of orientation parameter."""
         with pytest.raises(ValueError, match="Orientation must be"):
             GridConfig(orientation="vertical")
+    
+    def test_config_is_immutable(self):
+        """Test that a config cannot change after layouts are derived from it."""
+        config = GridConfig()
+        with pytest.raises(AttributeError):
+            config.rows = 4
+
+
+@pytest.fixture(scope="class")
+def gen_3x3():
+    """3×3 grid generator shared by read-only layout tests."""
+    return PDFGenerator(GridConfig(rows=3, cols=3))
+
+
+@pytest.fixture(scope="class")
+def gen_2x3():
+    """2×3 grid generator shared by read-only layout tests."""
+    return PDFGenerator(GridConfig(rows=2, cols=3))
+
+
+@pytest.fixture(scope="class")
+def gen_2x4():
+    """2×4 grid generator shared by read-only layout tests."""
+    return PDFGenerator(GridConfig(rows=2, cols=4))
 
 
 class TestPDFGenerator:
     """Tests for PDFGenerator class."""
     
-    def test_initialization(self):
+    def test_incomplete_layout_rejected_at_creation(self):
+        """Test that a layout missing _draw_page cannot be instantiated."""
+        class SizeOnly(_GridPDFGenerator):
+            def _calculate_card_dimensions(self):
+                return 100.0, 140.0
+        
+        with pytest.raises(TypeError, match="_draw_page"):
+            SizeOnly(GridConfig(rows=2, cols=2))
+    
+    def test_layout_shared_for_equal_configs(self):
+        """Test that generators with equal configs reuse the computed layout."""
+        first = PDFGenerator(GridConfig(rows=2, cols=3))
+        second = PDFGenerator(GridConfig(rows=2, cols=3))
+        
+        assert second.positions is first.positions
+        assert second.card_width == first.card_width
+    
+    def test_initialization(self, gen_3x3):
         """Test PDF generator initialization."""
-        config = GridConfig(rows=3, cols=3)
-        generator = PDFGenerator(config)
+        generator = gen_3x3
         
-        assert generator.config == config
+        assert generator.config == GridConfig(rows=3, cols=3)
         assert generator.page_width > 0
         assert generator.page_height > 0
         assert generator.card_width > 0
@@ -83,10 +126,10 @@ class TestPDFGenerator:
         assert generator.page_width == pytest.approx(841.89, rel=0.01)
         assert generator.page_height == pytest.approx(595.27, rel=0.01)
     
-    def test_card_dimensions_3x3(self):
+    def test_card_dimensions_3x3(self, gen_3x3):
         """Test card dimension calculation for 3x3 grid."""
-        config = GridConfig(rows=3, cols=3)
-        generator = PDFGenerator(config)
+        generator = gen_3x3
+        config = generator.config
         
         # Cards should fit within page
         total_width = (3 * generator.card_width + 2 * config.gap_x + 2 * config.margin)
@@ -100,10 +143,10 @@ class TestPDFGenerator:
         expected_aspect = PDFGenerator.CARD_ASPECT_RATIO
         assert aspect == pytest.approx(expected_aspect, rel=0.01)
     
-    def test_card_dimensions_2x4(self):
+    def test_card_dimensions_2x4(self, gen_2x4):
         """Test card dimension calculation for 2x4 grid."""
-        config = GridConfig(rows=2, cols=4)
-        generator = PDFGenerator(config)
+        generator = gen_2x4
+        config = generator.config
         
         # Cards should fit within page
         total_width = (4 * generator.card_width + 3 * config.gap_x + 2 * config.margin)
@@ -112,12 +155,9 @@ class TestPDFGenerator:
         assert total_width <= generator.page_width
         assert total_height <= generator.page_height
     
-    def test_positions_count(self):
+    def test_positions_count(self, gen_2x3):
         """Test that correct number of positions are calculated."""
-        config = GridConfig(rows=2, cols=3)
-        generator = PDFGenerator(config)
-        
-        assert len(generator.positions) == 6  # 2x3 = 6
+        assert len(gen_2x3.positions) == 6  # 2x3 = 6
     
     def test_positions_ordering(self):
         """Test that positions are ordered correctly (bottom-left, row by row)."""
@@ -136,10 +176,9 @@ class TestPDFGenerator:
         assert generator.positions[0][0] < generator.positions[1][0]
         assert generator.positions[2][0] < generator.positions[3][0]
     
-    def test_back_order_3x3(self):
+    def test_back_order_3x3(self, gen_3x3):
         """Test back order calculation for 3x3 grid."""
-        config = GridConfig(rows=3, cols=3)
-        generator = PDFGenerator(config)
+        generator = gen_3x3
         
         # Expected: each row reversed
         # Row 0: [0,1,2] -> [2,1,0]
@@ -148,10 +187,9 @@ class TestPDFGenerator:
         expected = [2, 1, 0, 5, 4, 3, 8, 7, 6]
         assert generator.back_order == expected
     
-    def test_back_order_2x4(self):
+    def test_back_order_2x4(self, gen_2x4):
         """Test back order calculation for 2x4 grid."""
-        config = GridConfig(rows=2, cols=4)
-        generator = PDFGenerator(config)
+        generator = gen_2x4
         
         # Expected: each row reversed
         # Row 0: [0,1,2,3] -> [3,2,1,0]
@@ -159,7 +197,16 @@ class TestPDFGenerator:
         expected = [3, 2, 1, 0, 7, 6, 5, 4]
         assert generator.back_order == expected
     
-    def test_generate_pdf_creates_file(self, tmp_path):
+    def test_slots_follow_back_order(self):
+        """Test that precomputed slots pair positions with card indices."""
+        config = GridConfig(rows=2, cols=2)
+        generator = PDFGenerator(config)
+        
+        assert [idx for idx, _ in generator.front_slots] == [0, 1, 2, 3]
+        assert [idx for idx, _ in generator.back_slots] == generator.back_order
+        assert [pos for _, pos in generator.back_slots] == generator.positions
+    
+    def test_generate_pdf_creates_file(self, tmp_path, card_images):
         """Test that PDF file is created."""
         config = GridConfig(rows=2, cols=2)
         generator = PDFGenerator(config)
@@ -168,10 +215,10 @@ class TestPDFGenerator:
         image_dir = tmp_path / "images"
         image_dir.mkdir()
         
-        for i in range(3):
-            for side in ["front", "back"]:
-                img = Image.new("RGB", (210, 298), color="white")
-                img.save(image_dir / f"card{i}_{side}.png")
+        card_images(
+            image_dir,
+            *(f"card{i}_{side}.png" for i in range(3) for side in ("front", "back"))
+        )
         
         # Generate PDF
         output_path = tmp_path / "output.pdf"
@@ -184,7 +231,7 @@ class TestPDFGenerator:
         assert result["total_pages"] == 2  # 1 group = 2 pages (front + back)
         assert len(result["missing_files"]) == 0
     
-    def test_generate_pdf_multiple_pages(self, tmp_path):
+    def test_generate_pdf_multiple_pages(self, tmp_path, card_images):
         """Test PDF generation with multiple pages."""
         config = GridConfig(rows=2, cols=2)  # 4 cards per page
         generator = PDFGenerator(config)
@@ -193,10 +240,10 @@ class TestPDFGenerator:
         image_dir = tmp_path / "images"
         image_dir.mkdir()
         
-        for i in range(6):
-            for side in ["front", "back"]:
-                img = Image.new("RGB", (210, 298), color="white")
-                img.save(image_dir / f"card{i}_{side}.png")
+        card_images(
+            image_dir,
+            *(f"card{i}_{side}.png" for i in range(6) for side in ("front", "back"))
+        )
         
         # Generate PDF
         output_path = tmp_path / "output.pdf"
@@ -208,7 +255,35 @@ class TestPDFGenerator:
         assert result["total_cards"] == 6
         assert result["total_pages"] == 4  # 2 groups × 2 pages each
     
-    def test_generate_pdf_missing_images(self, tmp_path):
+    def test_generate_pdf_accepts_generator(self, tmp_path):
+        """Test that card names can be produced lazily by a generator."""
+        config = GridConfig(rows=2, cols=2)
+        generator = PDFGenerator(config)
+        
+        output_path = tmp_path / "output.pdf"
+        card_names = (f"card{i}" for i in range(5))
+        
+        result = generator.generate_pdf(card_names, output_path, tmp_path)
+        
+        assert output_path.exists()
+        assert result["total_cards"] == 5
+        assert result["total_pages"] == 4
+        assert len(result["missing_files"]) == 10
+    
+    def test_generate_pdf_skips_empty_groups(self, tmp_path):
+        """Test that a page with only empty slots is not emitted."""
+        config = GridConfig(rows=1, cols=2)
+        generator = PDFGenerator(config)
+        
+        output_path = tmp_path / "output.pdf"
+        result = generator.generate_pdf(
+            ["card0", None, None, None, "card1"], output_path, tmp_path
+        )
+        
+        assert result["total_cards"] == 2
+        assert result["total_pages"] == 4  # middle group is empty
+    
+    def test_generate_pdf_missing_images(self, tmp_path, card_images):
         """Test PDF generation with missing images."""
         config = GridConfig(rows=2, cols=2)
         generator = PDFGenerator(config)
@@ -217,9 +292,7 @@ class TestPDFGenerator:
         image_dir = tmp_path / "images"
         image_dir.mkdir()
         
-        img = Image.new("RGB", (210, 298), color="white")
-        img.save(image_dir / "card0_front.png")
-        img.save(image_dir / "card0_back.png")
+        card_images(image_dir, "card0_front.png", "card0_back.png")
         # card1 images missing
         
         # Generate PDF
@@ -232,7 +305,55 @@ class TestPDFGenerator:
         assert result["total_cards"] == 2
         assert len(result["missing_files"]) == 2  # card1_front and card1_back
     
-    def test_generate_pdf_creates_output_dir(self, tmp_path):
+    def test_generate_pdf_in_memory_images(self, tmp_path):
+        """Test PDF generation from in-memory images instead of files."""
+        config = GridConfig(rows=2, cols=2)
+        generator = PDFGenerator(config)
+        
+        img = Image.new("RGB", (210, 298), color="white")
+        images = {"card0": (img, img), "card1": (img, img)}
+        
+        # card2 has no in-memory images
+        output_path = tmp_path / "output.pdf"
+        result = generator.generate_pdf(
+            ["card0", "card1", "card2"], output_path, tmp_path, images=images
+        )
+        
+        assert output_path.exists()
+        assert result["total_pages"] == 2
+        assert len(result["missing_files"]) == 2  # card2 front and back
+    
+    def test_generate_pdfs_multiple_layouts(self, tmp_path, card_images):
+        """Test generating several PDFs of the same cards in one call."""
+        card_images(tmp_path, "card0_front.png", "card0_back.png", "card1_front.png")
+        
+        jobs = [
+            (PDFGenerator(GridConfig(rows=2, cols=2)), tmp_path / "grid.pdf"),
+            (SingleCardPDFGenerator(), tmp_path / "single.pdf"),
+        ]
+        results = generate_pdfs(jobs, ["card0", "card1"], tmp_path)
+        
+        assert (tmp_path / "grid.pdf").exists()
+        assert (tmp_path / "single.pdf").exists()
+        assert results[0]["total_pages"] == 2
+        assert results[0]["missing_files"] == [str(tmp_path / "card1_back.png")]
+        assert results[1]["total_pages"] == 4
+    
+    def test_generate_pdfs_in_worker_processes(self, tmp_path, card_images):
+        """Test generating PDFs in parallel worker processes."""
+        card_images(tmp_path, "card0_front.png", "card0_back.png")
+        
+        jobs = [
+            (PDFGenerator(GridConfig(rows=2, cols=2)), tmp_path / "grid.pdf"),
+            (CutReadyPDFGenerator(GridConfig(rows=2, cols=2)), tmp_path / "cut.pdf"),
+        ]
+        results = generate_pdfs(jobs, ["card0"], tmp_path, max_workers=2)
+        
+        assert (tmp_path / "grid.pdf").exists()
+        assert (tmp_path / "cut.pdf").exists()
+        assert [r["total_pages"] for r in results] == [2, 2]
+    
+    def test_generate_pdf_creates_output_dir(self, tmp_path, card_images):
         """Test that output directory is created if it doesn't exist."""
         config = GridConfig(rows=2, cols=2)
         generator = PDFGenerator(config)
@@ -241,9 +362,7 @@ class TestPDFGenerator:
         image_dir = tmp_path / "images"
         image_dir.mkdir()
         
-        img = Image.new("RGB", (210, 298), color="white")
-        img.save(image_dir / "card0_front.png")
-        img.save(image_dir / "card0_back.png")
+        card_images(image_dir, "card0_front.png", "card0_back.png")
         
         # Output to non-existent directory
         output_path = tmp_path / "output" / "subdir" / "test.pdf"
@@ -267,7 +386,7 @@ class TestSingleCardPDFGenerator:
         assert generator.A7_HEIGHT == 298
         assert generator.page_size == (210, 298)
     
-    def test_generate_pdf_creates_file(self, tmp_path):
+    def test_generate_pdf_creates_file(self, tmp_path, card_images):
         """Test that PDF file is created with A7 pages."""
         generator = SingleCardPDFGenerator()
         
@@ -275,10 +394,10 @@ class TestSingleCardPDFGenerator:
         image_dir = tmp_path / "images"
         image_dir.mkdir()
         
-        for i in range(2):
-            for side in ["front", "back"]:
-                img = Image.new("RGB", (210, 298), color="white")
-                img.save(image_dir / f"card{i}_{side}.png")
+        card_images(
+            image_dir,
+            *(f"card{i}_{side}.png" for i in range(2) for side in ("front", "back"))
+        )
         
         # Generate PDF
         output_path = tmp_path / "output.pdf"
@@ -291,7 +410,7 @@ class TestSingleCardPDFGenerator:
         assert result["total_pages"] == 4  # 2 cards × 2 pages each
         assert len(result["missing_files"]) == 0
     
-    def test_generate_pdf_alternates_front_back(self, tmp_path):
+    def test_generate_pdf_alternates_front_back(self, tmp_path, card_images):
         """Test that pages alternate between front and back."""
         generator = SingleCardPDFGenerator()
         
@@ -299,9 +418,7 @@ class TestSingleCardPDFGenerator:
         image_dir = tmp_path / "images"
         image_dir.mkdir()
         
-        img = Image.new("RGB", (210, 298), color="white")
-        img.save(image_dir / "card0_front.png")
-        img.save(image_dir / "card0_back.png")
+        card_images(image_dir, "card0_front.png", "card0_back.png")
         
         # Generate PDF
         output_path = tmp_path / "output.pdf"
@@ -309,7 +426,7 @@ class TestSingleCardPDFGenerator:
         
         assert result["total_pages"] == 2  # Front, then back
     
-    def test_generate_pdf_missing_images(self, tmp_path):
+    def test_generate_pdf_missing_images(self, tmp_path, card_images):
         """Test handling of missing images."""
         generator = SingleCardPDFGenerator()
         
@@ -317,8 +434,7 @@ class TestSingleCardPDFGenerator:
         image_dir = tmp_path / "images"
         image_dir.mkdir()
         
-        img = Image.new("RGB", (210, 298), color="white")
-        img.save(image_dir / "card0_front.png")
+        card_images(image_dir, "card0_front.png")
         # card0_back.png missing
         
         # Generate PDF
@@ -376,7 +492,7 @@ class TestCutReadyPDFGenerator:
         expected = [2, 1, 0, 5, 4, 3]
         assert generator.back_order == expected
     
-    def test_generate_pdf_creates_file(self, tmp_path):
+    def test_generate_pdf_creates_file(self, tmp_path, card_images):
         """Test that cut-ready PDF file is created."""
         config = GridConfig(rows=2, cols=2, margin=5, gap_x=5, gap_y=5)
         generator = CutReadyPDFGenerator(config)
@@ -385,10 +501,10 @@ class TestCutReadyPDFGenerator:
         image_dir = tmp_path / "images"
         image_dir.mkdir()
         
-        for i in range(3):
-            for side in ["front", "back"]:
-                img = Image.new("RGB", (210, 298), color="white")
-                img.save(image_dir / f"card{i}_{side}.png")
+        card_images(
+            image_dir,
+            *(f"card{i}_{side}.png" for i in range(3) for side in ("front", "back"))
+        )
         
         # Generate PDF
         output_path = tmp_path / "output.pdf"
@@ -413,6 +529,58 @@ class TestCutReadyPDFGenerator:
         gen_landscape = CutReadyPDFGenerator(config_landscape)
         assert gen_landscape.page_width > gen_landscape.page_height
     
+    def test_bleed_background_fills_overlaps(self, tmp_path):
+        """Test that bleed rectangles overlapping across a 5pt gap stay black."""
+        config = GridConfig(rows=2, cols=2, margin=5, gap_x=5, gap_y=5)
+        generator = CutReadyPDFGenerator(config)
+        
+        # Two neighbouring cards with the CLI's default cut-ready gap; their
+        # bleed rectangles overlap over the whole gap
+        positions = [(50, 50), (50 + generator.card_width + 5, 50)]
+        
+        output_path = tmp_path / "bleed.pdf"
+        c = canvas.Canvas(str(output_path), pageCompression=0)
+        generator._draw_bleed_background(c, positions)
+        c.showPage()
+        c.save()
+        
+        # Non-zero fill ("f"), not even-odd ("f*"), which would leave the
+        # overlap white
+        content = output_path.read_bytes()
+        assert b" re\nf\n" in content
+        assert b"f*" not in content
+    
+    def test_bleed_background_covers_default_gap(self, tmp_path):
+        """Test that the black bleed spans the gaps at the default 5pt gap."""
+        config = GridConfig(rows=2, cols=2, margin=5, gap_x=5, gap_y=5)
+        generator = CutReadyPDFGenerator(config)
+        
+        output_path = tmp_path / "bleed.pdf"
+        c = canvas.Canvas(str(output_path), pageCompression=0)
+        generator._draw_bleed_background(c, generator.positions)
+        c.showPage()
+        c.save()
+        
+        # Parse the emitted "x y w h re" rectangles
+        tokens = output_path.read_bytes().split()
+        rects = [
+            tuple(float(t) for t in tokens[i - 4:i])
+            for i, token in enumerate(tokens) if token == b"re"
+        ]
+        assert len(rects) == len(generator.positions)
+        
+        # Every column and row gap between two cards is covered in black
+        xs = sorted({x for x, _ in generator.positions})
+        ys = sorted({y for _, y in generator.positions})
+        gaps = [(xs[0] + generator.card_width, xs[1], 0),
+                (ys[0] + generator.card_height, ys[1], 1)]
+        for gap_start, gap_end, axis in gaps:
+            assert gap_end - gap_start == pytest.approx(5)
+            assert any(
+                rect[axis] <= gap_start and rect[axis] + rect[axis + 2] >= gap_end
+                for rect in rects
+            )
+    
     def test_bleed_dimensions(self):
         """Test that bleed is correctly calculated."""
         config = GridConfig(rows=2, cols=2, margin=5, gap_x=5, gap_y=5)
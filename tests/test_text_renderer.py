@@ -2,17 +2,13 @@
 
 import pytest
 from pathlib import Path
-from PIL import Image, ImageFont
+from PIL import Image, ImageDraw, ImageFont
 from src.text_renderer import TextRenderer
 
 
-@pytest.fixture
-def font_path(tmp_path):
-    """Create a temporary font file path."""
-    # For testing, we'll use a system font or create a dummy path
-    # In real tests, you'd want to include a test font
-    font_file = tmp_path / "test.ttf"
-    
+@pytest.fixture(scope="session")
+def font_path():
+    """Find a system font for the tests (probed once per session)."""
     # Try to find a system font for testing
     system_fonts = [
         "/System/Library/Fonts/Helvetica.ttc",  # macOS
@@ -34,6 +30,11 @@ def renderer(font_path):
     return TextRenderer(font_path)
 
 
+def _image_modified(img):
+    """Check whether anything was drawn on an all-white RGB image."""
+    return img.getextrema() != ((255, 255),) * 3
+
+
 def test_text_renderer_init(font_path):
     """Test TextRenderer initialization."""
     renderer = TextRenderer(font_path)
@@ -63,6 +64,19 @@ def test_measure_text(renderer):
     assert width2 > width
 
 
+def test_measure_text_caching(renderer):
+    """Test that measurements are cached per text and size."""
+    assert renderer.measure_text("Hello", 24) == renderer.measure_text("Hello", 24)
+    assert ("Hello", 24) in renderer._measure_cache
+    assert ("Hello", 12) not in renderer._measure_cache
+
+
+def test_measure_height_matches_measure_text(renderer):
+    """Test that per-glyph line heights match the full line measurement."""
+    for text in ["Hello", "quietly", "A B", "Range: 60 feet (Self)", ""]:
+        assert renderer.measure_height(text, 24) == renderer.measure_text(text, 24)[1]
+
+
 def test_measure_text_empty(renderer):
     """Test measuring empty text."""
     width, height = renderer.measure_text("", 24)
@@ -109,6 +123,16 @@ def test_wrap_text_with_paragraphs(renderer):
     assert len([l for l in lines if l is not None]) >= 2
 
 
+def test_wrap_text_caching(renderer):
+    """Test that cached wraps are returned as independent lists."""
+    lines = renderer.wrap_text("First paragraph.\n\nSecond paragraph.", 50)
+    lines.append("changed")
+    
+    assert renderer.wrap_text("First paragraph.\n\nSecond paragraph.", 50) == [
+        "First paragraph.", None, "Second paragraph."
+    ]
+
+
 def test_calculate_text_height(renderer):
     """Test text height calculation."""
     lines = ["Line 1", "Line 2", "Line 3"]
@@ -178,6 +202,42 @@ def test_find_optimal_font_size_short_text(renderer):
     assert size == 50
 
 
+def test_draw_line_matches_draw_text(renderer):
+    """Test that cached line masks give the same pixels as ImageDraw.text."""
+    for text, color in [("1 action", "black"), ("gj(Q), V", (200, 10, 10))]:
+        expected = Image.new('RGBA', (300, 60), (120, 200, 90, 180))
+        ImageDraw.Draw(expected).text(
+            (7, 9), text, font=renderer.get_font(20), fill=color
+        )
+        
+        for _ in range(2):  # Second pass uses the cached mask
+            img = Image.new('RGBA', (300, 60), (120, 200, 90, 180))
+            renderer.draw_line(img, (7, 9), text, 20, color)
+            assert img.tobytes() == expected.tobytes()
+        assert (text, 20) in renderer._line_cache
+
+
+def test_find_optimal_font_size_no_room(renderer):
+    """Test that a box with no height left falls back to the minimum size."""
+    for max_height in [0, -5]:
+        size = renderer.find_optimal_font_size(
+            "Some text", min_size=10, max_size=40, max_width=300, max_height=max_height
+        )
+        assert size == 10
+
+
+def test_find_optimal_font_size_caching(renderer):
+    """Test that the search result is cached per argument tuple."""
+    args = ("Some text " * 20, 10, 40, 300, 200)
+    size = renderer.find_optimal_font_size(*args)
+    assert (*args, 2, 10) in renderer._size_cache
+    
+    renderer._measure_cache.clear()
+    renderer._wrap_cache.clear()
+    assert renderer.find_optimal_font_size(*args) == size
+    assert not renderer._measure_cache and not renderer._wrap_cache
+
+
 def test_render_text_centered(renderer):
     """Test centered text rendering."""
     img = Image.new('RGB', (400, 200), 'white')
@@ -192,8 +252,7 @@ def test_render_text_centered(renderer):
     )
     
     # Image should be modified (not all white)
-    pixels = list(img.getdata())
-    assert not all(p == (255, 255, 255) for p in pixels)
+    assert _image_modified(img)
 
 
 def test_render_text_left_aligned(renderer):
@@ -210,8 +269,7 @@ def test_render_text_left_aligned(renderer):
     )
     
     # Image should be modified
-    pixels = list(img.getdata())
-    assert not all(p == (255, 255, 255) for p in pixels)
+    assert _image_modified(img)
 
 
 def test_render_text_with_paragraphs(renderer):
@@ -230,8 +288,7 @@ def test_render_text_with_paragraphs(renderer):
     )
     
     # Image should be modified
-    pixels = list(img.getdata())
-    assert not all(p == (255, 255, 255) for p in pixels)
+    assert _image_modified(img)
 
 
 def test_render_empty_text(renderer):